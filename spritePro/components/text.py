@@ -1,6 +1,7 @@
 # text_sprite.py
 
 import pygame
+from collections import OrderedDict
 from pathlib import Path
 from typing import Tuple, Optional, Union, TYPE_CHECKING
 
@@ -13,6 +14,12 @@ if TYPE_CHECKING:
 
 _FONT_CACHE: dict[tuple[str | None, int], pygame.font.Font] = {}
 
+# Отрисованные строки, общие для всех TextSprite: повторяющиеся значения
+# (счёт, проценты, FPS) не рендерятся шрифтом заново. set_image копирует
+# поверхность, поэтому закэшированный оригинал никогда не изменяется.
+_RENDER_CACHE: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+_RENDER_CACHE_MAX = 256
+
 
 class TextSprite(Sprite):
     """Спрайт, отображающий текст со всеми базовыми механиками Sprite.
@@ -201,7 +208,15 @@ class TextSprite(Sprite):
         render_key = (font_key, display_str, self.color)
         if self._render_cache_key == render_key:
             return self
-        surf = self._render_text_multiline(display_str)
+        shared_key = (font_key, display_str, tuple(self.color))
+        surf = _RENDER_CACHE.get(shared_key)
+        if surf is None:
+            surf = self._render_text_multiline(display_str)
+            _RENDER_CACHE[shared_key] = surf
+            if len(_RENDER_CACHE) > _RENDER_CACHE_MAX:
+                _RENDER_CACHE.popitem(last=False)
+        else:
+            _RENDER_CACHE.move_to_end(shared_key)
         self.set_image(surf)
         self._render_cache_key = render_key
         return self
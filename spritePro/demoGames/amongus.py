@@ -21,12 +21,25 @@ def on_canistra():
     global cacanistra_count
     cacanistra_count += 1
     s.debug_log_info(cacanistra_count)
-    canistra_bar.set_image("", (200, cacanistra_count / canistra_max * 250))
+    set_canistra_fill(cacanistra_count)
     if cacanistra_count >= canistra_max + 1:
         canistra_bg.set_active(False)
         canistra_bar.set_active(False)
 
 
+def set_canistra_fill(count: int) -> None:
+    """Показывает в полосе канистры заполнение count из canistra_max."""
+    # Полоса — верхняя часть заранее залитой поверхности: без новой заливки на клик
+    height = int(min(count, canistra_max) / canistra_max * canistra_fill.get_height())
+    canistra_bar.set_image(canistra_fill.subsurface((0, 0, canistra_fill.get_width(), height)))
+
+
+def find_interact_zone() -> int:
+    """Индекс первой зоны взаимодействия под игроком или -1."""
+    # collidelist проходит список прямоугольников на стороне C за один вызов
+    return player.collide.rect.collidelist(interact_rects)
+
+
 s.init()
 
 s.get_screen((1280, 960))
@@ -35,9 +48,18 @@ bg = s.Sprite("spritePro/demoGames/Sprites/map.jpg")
 bg.set_native_size()
 bg.set_sorting_order(-1000)
 player = s.Sprite("spritePro/demoGames/Sprites/amogus.png")
+# Конструктор подгоняет картинку под размер по умолчанию (50x50), поэтому сначала
+# возвращаем родной размер 900x907 и уже его один раз уменьшаем до итогового
+# (~63x63), а не держим scale=0.07: иначе каждая перестройка трансформации
+# заново сжимала бы полную картинку
 player.set_native_size()
+player_w, player_h = player.original_image.get_size()
+player.set_image(
+    pygame.transform.smoothscale(
+        player.original_image, (int(player_w * 0.07), int(player_h * 0.07))
+    )
+)
 player.set_position((400, 300))
-player.set_scale(0.07)
 player.speed = 5
 player.collide = s.Sprite("", (30, 50), player.rect.center)
 player.collide.set_parent(player)
@@ -72,7 +94,11 @@ btn_interactive.set_image(circle)
 btn_interactive.text_sprite.set_screen_space(True)
 btn_interactive.set_screen_space(True)
 
-interacts = [t1, t2, canistra]
+# Зоны взаимодействия статичны: снимаем их прямоугольники один раз
+# (порядок важен — индекс попадания выбирает действие по SPACE)
+interact_rects = [pygame.Rect(t1.rect), pygame.Rect(t2.rect), pygame.Rect(canistra.rect)]
+# Точки телепорта для зон 0 и 1 (t1 -> t2, t2 -> t1), тоже снимаются один раз
+teleport_targets = (interact_rects[1].center, interact_rects[0].center)
 
 img_canister = "spritePro/demoGames/Sprites/canister.png"
 canistra_bg = s.Button(img_canister, (400, 400), s.WH_C, "", on_click=on_canistra)
@@ -84,6 +110,9 @@ canistra_bar.set_screen_space(True)
 canistra_bar.set_sorting_order(1010)
 canistra_bar.set_color((255, 255, 100))
 canistra_bar.set_alpha(100)
+# Полностью залитая полоса: клики по канистре только выбирают её высоту
+canistra_fill = pygame.Surface((200, 250), pygame.SRCALPHA).convert_alpha()
+canistra_fill.fill(canistra_bar.color)
 canistra_bar.set_position(canistra_bg.rect.bottomleft, s.Anchor.BOTTOM_LEFT)
 canistra_bar.rect.x += 100
 canistra_bar.rect.y += -50
@@ -115,6 +144,10 @@ text_debug = s.TextSprite("debug", 24)
 text_debug.set_position((s.WH_C.x, s.WH.y - 50), s.Anchor.MID_BOTTOM)
 text_debug.set_screen_space(True)
 
+# Центр игрока на момент последнего пересчёта зон взаимодействия и
+# текста координат: пока игрок стоит на месте, они не меняются
+last_interact_center = None
+
 # Main game loop
 while True:
     k_space = False
@@ -130,23 +163,33 @@ while True:
 
     # --- 3. Остальная логика кадра ---
     s.set_camera_follow(player)
-    text_cord.text = f"player cord: x:{player.rect.centerx}, y:{player.rect.centery}"
-
-    if k_space:
-        if t1.rect.colliderect(player.collide.rect):
-            player.set_position(t2.rect.center)
-        elif t2.rect.colliderect(player.collide.rect):
-            player.set_position(t1.rect.center)
-        elif canistra.rect.colliderect(player.collide.rect):
-            cacanistra_count = 0
-            canistra_bar.set_image("", (200, cacanistra_count / canistra_max * 250))
-            canistra_bg.set_active(True)
-            canistra_bar.set_active(True)
+
+    # Пока игрок стоит и SPACE не нажат, логика кадра не меняет ничего:
+    # ни зоны взаимодействия, ни текст координат не пересчитываются
+    if k_space or player.rect.center != last_interact_center:
+        hit = find_interact_zone()
+        if k_space and hit != -1:
+            if hit < len(teleport_targets):
+                # Через set_position, а не rect: мировая позиция игрока и
+                # физика движения должны узнать о телепорте
+                player.set_position(teleport_targets[hit])
+            else:
+                cacanistra_count = 0
+                set_canistra_fill(cacanistra_count)
+                if not canistra_bg.active_self:
+                    canistra_bg.set_active(True)
+                    canistra_bar.set_active(True)
+            # После телепорта игрок стоит уже в другой зоне
+            hit = find_interact_zone()
         k_space = False
 
-    # Проверка для кнопки "Взаимодействовать"
-    can_interact = any(i.rect.colliderect(player.collide.rect) for i in interacts)
-    btn_interactive.active = can_interact
+        # Кнопка "Взаимодействовать" переключается только при входе/выходе из зоны
+        in_zone = hit != -1
+        if btn_interactive.active_self != in_zone:
+            btn_interactive.active = in_zone
+        last_interact_center = player.rect.center
+        cx, cy = last_interact_center
+        text_cord.text = f"player cord: x:{cx}, y:{cy}"
 
     # Обновляем текст отладки
     is_colliding_with_wall = any(player.collide.rect.colliderect(w.rect) for w in walls)
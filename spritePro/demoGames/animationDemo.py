@@ -1,5 +1,5 @@
 import pygame
-import math
+from math import cos, sin, tau
 import sys
 from pathlib import Path
 
@@ -25,34 +25,18 @@ def run_animation_demo():
     # Создание кадров анимации
     frames = []
 
-    # Вспомогательный спрайт для генерации линии через set_polyline
-    line_sprite = spritePro.Sprite("", (1, 1), (0, 0))
-    line_sprite.set_active(False)
-
+    # Кадры рисуются сразу в итоговые поверхности, без промежуточного спрайта
     count = 60
+    step = tau / count  # угол между кадрами сразу в радианах
     for i in range(count):  # кадров для плавного вращения
-        angle = i * 360 / count  # градусов между кадрами
-        end_x = 50 + 40 * math.cos(math.radians(angle))
-        end_y = 50 + 40 * math.sin(math.radians(angle))
-        points = [(50, 50), (end_x, end_y)]
-
-        padding = 2
-        xs = [p[0] for p in points]
-        ys = [p[1] for p in points]
-        min_x = min(xs)
-        min_y = min(ys)
-        origin_x = 50 - min_x + padding
-        origin_y = 50 - min_y + padding
-
-        line_sprite.set_polyline(points, color=(255, 255, 255), width=3, padding=padding)
-        frame = pygame.Surface((100, 100), pygame.SRCALPHA)
-        frame.blit(
-            line_sprite.image,
-            (int(50 - origin_x), int(50 - origin_y)),
-        )
-        frames.append(frame)
+        angle = i * step
+        end_x = 50 + 40 * cos(angle)
+        end_y = 50 + 40 * sin(angle)
 
-    line_sprite.kill()
+        frame = pygame.Surface((100, 100), pygame.SRCALPHA)
+        pygame.draw.line(frame, (255, 255, 255), (50, 50), (end_x, end_y), 3)
+        # Формат экрана: кадры блитятся без попиксельной конвертации
+        frames.append(frame.convert_alpha())
 
     # Создание анимации
     animation = Animation(
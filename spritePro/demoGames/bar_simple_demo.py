@@ -81,6 +81,13 @@ def main():
         color=(255, 255, 0),
     )
 
+    def set_debug(fill1: float, fill2: float) -> None:
+        # Заполнение меняется шагом 10%: квантуем, чтобы строк было конечное
+        # число (11 × 11) — повторные значения TextSprite берёт из кэша рендера
+        percent1 = round(fill1 * 10) * 10
+        percent2 = round(fill2 * 10) * 10
+        debug_text.text = f"Bar 1 (L→R): {percent1}% | Bar 2 (R→L): {percent2}%"
+
     # Image switching state
     background_switched = False
     fill_switched = False
@@ -88,101 +95,112 @@ def main():
     color_index = 0
     bg_colors = [(139, 0, 0), (0, 100, 0), (0, 0, 139)]  # DarkRed, DarkGreen, DarkBlue
     fill_colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]  # Red, Green, Blue
+    running = True
+
+    def on_quit() -> None:
+        nonlocal running
+        running = False
+
+    def change_fill(delta: float) -> None:
+        new_fill1 = min(1.0, max(0.0, bar.get_fill_amount() + delta))
+        bar.set_fill_amount(new_fill1, animate=True)
+
+        new_fill2 = min(1.0, max(0.0, bar2.get_fill_amount() + delta))
+        bar2.set_fill_amount(new_fill2, animate=True)
+
+        set_debug(new_fill1, new_fill2)
+
+    def on_decrease() -> None:
+        change_fill(-0.1)
+
+    def on_increase() -> None:
+        change_fill(0.1)
+
+    def on_toggle_background() -> None:
+        nonlocal background_switched
+        # Toggle between images and colors
+        if not background_switched:
+            # Switch to image files
+            bar.set_background_image(path_sprites + "bar_bg.png")
+            bar2.set_background_image(path_sprites + "fon.jpeg")
+            s.debug_log_info("Backgrounds switched to images!")
+        else:
+            # Switch back to colors (empty strings)
+            bar.set_background_image("")
+            bar2.set_background_image("")
+            bar.bg.color = (139, 0, 0)  # Восстанавливаем цвета
+            bar2.bg.color = (0, 100, 0)
+            s.debug_log_info("Backgrounds reset to colors!")
+        background_switched = not background_switched
+
+    def on_toggle_fill() -> None:
+        nonlocal fill_switched
+        # Toggle between images and colors
+        if not fill_switched:
+            # Switch to image files
+            bar.set_fill_image(path_sprites + "bar_fill.png")
+            bar2.set_fill_image(path_sprites + "background_game.png")
+            s.debug_log_info("Fill images switched!")
+        else:
+            # Switch back to colors (empty strings)
+            bar.set_fill_image("")
+            bar2.set_fill_image("")
+            bar.fill.color = (255, 0, 0)  # Восстанавливаем цвета
+            bar2.fill.color = (0, 255, 0)
+            s.debug_log_info("Fill images reset to colors!")
+        fill_switched = not fill_switched
+
+    def on_cycle_colors() -> None:
+        nonlocal color_index
+        # Change colors using bg.color and fill.color
+        color_index = (color_index + 1) % len(bg_colors)
+        new_bg_color = bg_colors[color_index]
+        new_fill_color = fill_colors[color_index]
+
+        # Используем удобный способ через bg.color и fill.color
+        bar.bg.color = new_bg_color
+        bar.fill.color = new_fill_color
+        bar2.bg.color = new_bg_color
+        bar2.fill.color = new_fill_color
+
+        s.debug_log_info(f"Colors changed! BG: {new_bg_color}, Fill: {new_fill_color}")
+
+    def on_toggle_sizes() -> None:
+        nonlocal size_switched
+        if not size_switched:
+            # Change to different sizes
+            bar.set_both_sizes((400, 60), (350, 40))  # Bigger background, smaller fill
+            bar2.set_both_sizes((200, 30), (250, 50))  # Smaller background, bigger fill
+            s.debug_log_info("Sizes changed!")
+        else:
+            # Reset to original sizes
+            bar.set_both_sizes((300, 50), (300, 50))  # Same size
+            bar2.set_both_sizes((300, 50), (300, 50))  # Same size
+            s.debug_log_info("Sizes reset!")
+        size_switched = not size_switched
+
+    # Обработчики клавиш: один поиск в словаре на KEYDOWN вместо цепочки if/elif
+    handlers = {
+        pygame.K_a: on_decrease,
+        pygame.K_d: on_increase,
+        pygame.K_b: on_toggle_background,
+        pygame.K_f: on_toggle_fill,
+        pygame.K_c: on_cycle_colors,
+        pygame.K_s: on_toggle_sizes,
+        pygame.K_q: on_quit,
+        pygame.K_ESCAPE: on_quit,
+    }
 
     # Demo loop
-    running = True
     while running:
         # Update and draw
         s.update(fps=60, update_display=True, fill_color=(25, 28, 35))
 
-        if s.input.was_pressed(pygame.K_q) or s.input.was_pressed(pygame.K_ESCAPE):
-            running = False
-
-        if s.input.was_pressed(pygame.K_a):
-            # Decrease both bars
-            current_fill1 = bar.get_fill_amount()
-            new_fill1 = max(0.0, current_fill1 - 0.1)
-            bar.set_fill_amount(new_fill1, animate=True)
-
-            current_fill2 = bar2.get_fill_amount()
-            new_fill2 = max(0.0, current_fill2 - 0.1)
-            bar2.set_fill_amount(new_fill2, animate=True)
-
-            debug_text.text = (
-                f"Bar 1 (L→R): {int(new_fill1 * 100)}% | Bar 2 (R→L): {int(new_fill2 * 100)}%"
-            )
-        elif s.input.was_pressed(pygame.K_d):
-            # Increase both bars
-            current_fill1 = bar.get_fill_amount()
-            new_fill1 = min(1.0, current_fill1 + 0.1)
-            bar.set_fill_amount(new_fill1, animate=True)
-
-            current_fill2 = bar2.get_fill_amount()
-            new_fill2 = min(1.0, current_fill2 + 0.1)
-            bar2.set_fill_amount(new_fill2, animate=True)
-
-            debug_text.text = (
-                f"Bar 1 (L→R): {int(new_fill1 * 100)}% | Bar 2 (R→L): {int(new_fill2 * 100)}%"
-            )
-        elif s.input.was_pressed(pygame.K_b):
-            # Toggle between images and colors
-            if not background_switched:
-                # Switch to image files
-                bar.set_background_image(path_sprites + "bar_bg.png")
-                bar2.set_background_image(path_sprites + "fon.jpeg")
-                background_switched = True
-                s.debug_log_info("Backgrounds switched to images!")
-            else:
-                # Switch back to colors (empty strings)
-                bar.set_background_image("")
-                bar2.set_background_image("")
-                bar.bg.color = (139, 0, 0)  # Восстанавливаем цвета
-                bar2.bg.color = (0, 100, 0)
-                background_switched = False
-                s.debug_log_info("Backgrounds reset to colors!")
-        elif s.input.was_pressed(pygame.K_f):
-            # Toggle between images and colors
-            if not fill_switched:
-                # Switch to image files
-                bar.set_fill_image(path_sprites + "bar_fill.png")
-                bar2.set_fill_image(path_sprites + "background_game.png")
-                fill_switched = True
-                s.debug_log_info("Fill images switched!")
-            else:
-                # Switch back to colors (empty strings)
-                bar.set_fill_image("")
-                bar2.set_fill_image("")
-                bar.fill.color = (255, 0, 0)  # Восстанавливаем цвета
-                bar2.fill.color = (0, 255, 0)
-                fill_switched = False
-                s.debug_log_info("Fill images reset to colors!")
-        elif s.input.was_pressed(pygame.K_c):
-            # Change colors using bg.color and fill.color
-            color_index = (color_index + 1) % len(bg_colors)
-            new_bg_color = bg_colors[color_index]
-            new_fill_color = fill_colors[color_index]
-
-            # Используем удобный способ через bg.color и fill.color
-            bar.bg.color = new_bg_color
-            bar.fill.color = new_fill_color
-            bar2.bg.color = new_bg_color
-            bar2.fill.color = new_fill_color
-
-            s.debug_log_info(f"Colors changed! BG: {new_bg_color}, Fill: {new_fill_color}")
-        elif s.input.was_pressed(pygame.K_s):
-            # Toggle sizes
-            if not size_switched:
-                # Change to different sizes
-                bar.set_both_sizes((400, 60), (350, 40))  # Bigger background, smaller fill
-                bar2.set_both_sizes((200, 30), (250, 50))  # Smaller background, bigger fill
-                size_switched = True
-                s.debug_log_info("Sizes changed!")
-            else:
-                # Reset to original sizes
-                bar.set_both_sizes((300, 50), (300, 50))  # Same size
-                bar2.set_both_sizes((300, 50), (300, 50))  # Same size
-                size_switched = False
-                s.debug_log_info("Sizes reset!")
+        for event in s.pygame_events:
+            if event.type == pygame.KEYDOWN:
+                handler = handlers.get(event.key)
+                if handler is not None:
+                    handler()
 
 
 if __name__ == "__main__":
@@ -6,6 +6,8 @@ Each text demonstrates a different color effect from the color_effects module.
 """
 
 import sys
+import time
+from functools import partial
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -26,12 +28,23 @@ class ColorTextDemo:
         # Demo state for dynamic effects
         self.health = 100.0
         self.temperature = 50.0
-        self.health_direction = -1
-        self.temp_direction = 1
+        # Effect clock in integer milliseconds from pygame.time.get_ticks():
+        # start is shifted forward by every pause, so values freeze while paused
+        self.effect_start_ms = pygame.time.get_ticks()
+        self.paused_at_ms = 0
+        self.shown_values = (100, 50)
 
         # Create text sprites for each effect
-        self.text_effects = []
+        # Parallel lists (one index per effect) instead of a dict per effect:
+        # the per-frame loops walk them with zip and no key lookups
+        self.effect_names = []
+        self.effect_funcs = []
+        self.effect_text_sprites = []
+        self.effect_rgb_sprites = []
+        self.static_texts = []
         self.setup_text_effects()
+        self.setup_static_labels()
+        self.setup_info_labels()
 
     def setup_text_effects(self):
         """Setup text sprites for each color effect."""
@@ -46,182 +59,194 @@ class ColorTextDemo:
         effects = [
             {
                 "text": "PULSE EFFECT",
-                "func": lambda: ColorEffects.pulse(speed=2.0),
+                "func": ColorEffects.pulse,
+                "params": {"speed": 2.0},
                 "description": "Black to white pulse",
             },
             {
                 "text": "RED PULSE",
-                "func": lambda: ColorEffects.pulse(
-                    speed=1.5, base_color=(50, 0, 0), target_color=(255, 0, 0)
-                ),
+                "func": ColorEffects.pulse,
+                "params": {"speed": 1.5, "base_color": (50, 0, 0), "target_color": (255, 0, 0)},
                 "description": "Dark red to bright red",
             },
             {
                 "text": "BLUE PULSE",
-                "func": lambda: ColorEffects.pulse(
-                    speed=1.8,
-                    base_color=(0, 0, 50),
-                    target_color=(0, 100, 255),
-                    intensity=0.8,
-                ),
+                "func": ColorEffects.pulse,
+                "params": {
+                    "speed": 1.8,
+                    "base_color": (0, 0, 50),
+                    "target_color": (0, 100, 255),
+                    "intensity": 0.8,
+                },
                 "description": "Blue pulse, 80% intensity",
             },
             {
                 "text": "RAINBOW COLORS",
-                "func": lambda: ColorEffects.rainbow(speed=1.0),
+                "func": ColorEffects.rainbow,
+                "params": {"speed": 1.0},
                 "description": "Full spectrum cycling",
             },
             {
                 "text": "FAST RAINBOW",
-                "func": lambda: ColorEffects.rainbow(speed=3.0, saturation=0.8),
+                "func": ColorEffects.rainbow,
+                "params": {"speed": 3.0, "saturation": 0.8},
                 "description": "Fast, less saturated",
             },
             {
                 "text": "PASTEL RAINBOW",
-                "func": lambda: ColorEffects.rainbow(speed=0.8, saturation=0.5, brightness=0.9),
+                "func": ColorEffects.rainbow,
+                "params": {"speed": 0.8, "saturation": 0.5, "brightness": 0.9},
                 "description": "Soft pastel colors",
             },
             {
                 "text": "BREATHING GREEN",
-                "func": lambda: ColorEffects.breathing(speed=0.8, base_color=(0, 150, 0)),
+                "func": ColorEffects.breathing,
+                "params": {"speed": 0.8, "base_color": (0, 150, 0)},
                 "description": "Green breathing effect",
             },
             {
                 "text": "BREATHING PURPLE",
-                "func": lambda: ColorEffects.breathing(
-                    speed=0.5, base_color=(150, 0, 150), intensity=0.6
-                ),
+                "func": ColorEffects.breathing,
+                "params": {"speed": 0.5, "base_color": (150, 0, 150), "intensity": 0.6},
                 "description": "Gentle purple breathing",
             },
             {
                 "text": "BREATHING ORANGE",
-                "func": lambda: ColorEffects.breathing(
-                    speed=0.6, base_color=(255, 150, 0), intensity=0.5
-                ),
+                "func": ColorEffects.breathing,
+                "params": {"speed": 0.6, "base_color": (255, 150, 0), "intensity": 0.5},
                 "description": "Soft orange breathing",
             },
             {
                 "text": "FIRE WAVE",
-                "func": lambda: ColorEffects.wave(
-                    speed=2.0, colors=[(255, 0, 0), (255, 100, 0), (255, 255, 0)]
-                ),
+                "func": ColorEffects.wave,
+                "params": {"speed": 2.0, "colors": [(255, 0, 0), (255, 100, 0), (255, 255, 0)]},
                 "description": "Fire colors wave",
             },
             {
                 "text": "OCEAN WAVE",
-                "func": lambda: ColorEffects.wave(
-                    speed=1.5, colors=[(0, 50, 100), (0, 150, 255), (100, 200, 255)]
-                ),
+                "func": ColorEffects.wave,
+                "params": {"speed": 1.5, "colors": [(0, 50, 100), (0, 150, 255), (100, 200, 255)]},
                 "description": "Ocean colors wave",
             },
             {
                 "text": "NEON WAVE",
-                "func": lambda: ColorEffects.wave(
-                    speed=2.5,
-                    colors=[(255, 0, 255), (0, 255, 255), (255, 255, 0), (255, 0, 128)],
-                ),
+                "func": ColorEffects.wave,
+                "params": {
+                    "speed": 2.5,
+                    "colors": [(255, 0, 255), (0, 255, 255), (255, 255, 0), (255, 0, 128)],
+                },
                 "description": "Neon colors wave",
             },
             {
                 "text": "CANDLE FLICKER",
-                "func": lambda: ColorEffects.flicker(
-                    speed=8.0, base_color=(255, 200, 100), flicker_color=(255, 150, 50)
-                ),
+                "func": ColorEffects.flicker,
+                "params": {
+                    "speed": 8.0,
+                    "base_color": (255, 200, 100),
+                    "flicker_color": (255, 150, 50),
+                },
                 "description": "Candle flame flicker",
             },
             {
                 "text": "ELECTRIC FLICKER",
-                "func": lambda: ColorEffects.flicker(
-                    speed=15.0,
-                    base_color=(200, 200, 255),
-                    flicker_color=(100, 100, 200),
-                    randomness=0.8,
-                ),
+                "func": ColorEffects.flicker,
+                "params": {
+                    "speed": 15.0,
+                    "base_color": (200, 200, 255),
+                    "flicker_color": (100, 100, 200),
+                    "randomness": 0.8,
+                },
                 "description": "Electric spark flicker",
             },
             {
                 "text": "BROKEN LIGHT",
-                "func": lambda: ColorEffects.flicker(
-                    speed=12.0,
-                    base_color=(255, 255, 255),
-                    flicker_color=(200, 200, 200),
-                    randomness=0.9,
-                ),
+                "func": ColorEffects.flicker,
+                "params": {
+                    "speed": 12.0,
+                    "base_color": (255, 255, 255),
+                    "flicker_color": (200, 200, 200),
+                    "randomness": 0.9,
+                },
                 "description": "Broken fluorescent light",
             },
             {
                 "text": "FAST STROBE",
-                "func": lambda: ColorEffects.strobe(
-                    speed=8.0, on_color=(255, 255, 255), off_color=(0, 0, 0)
-                ),
+                "func": ColorEffects.strobe,
+                "params": {"speed": 8.0, "on_color": (255, 255, 255), "off_color": (0, 0, 0)},
                 "description": "Fast white strobe",
             },
             {
                 "text": "PURPLE STROBE",
-                "func": lambda: ColorEffects.strobe(
-                    speed=3.0,
-                    on_color=(255, 0, 255),
-                    off_color=(50, 0, 50),
-                    duty_cycle=0.3,
-                ),
+                "func": ColorEffects.strobe,
+                "params": {
+                    "speed": 3.0,
+                    "on_color": (255, 0, 255),
+                    "off_color": (50, 0, 50),
+                    "duty_cycle": 0.3,
+                },
                 "description": "Purple strobe, 30% duty",
             },
             {
                 "text": "SLOW STROBE",
-                "func": lambda: ColorEffects.strobe(
-                    speed=1.5,
-                    on_color=(0, 255, 0),
-                    off_color=(0, 50, 0),
-                    duty_cycle=0.7,
-                ),
+                "func": ColorEffects.strobe,
+                "params": {
+                    "speed": 1.5,
+                    "on_color": (0, 255, 0),
+                    "off_color": (0, 50, 0),
+                    "duty_cycle": 0.7,
+                },
                 "description": "Slow green strobe",
             },
             {
                 "text": f"TEMPERATURE: {self.temperature:.0f}°C",
-                "func": lambda: ColorEffects.temperature(self.temperature, 0, 100),
+                "func": self.temperature_color,
+                "params": {},
                 "description": "Temperature-based color",
             },
             {
                 "text": f"HEALTH: {self.health:.0f}%",
-                "func": lambda: ColorEffects.health_bar(self.health, 100),
+                "func": self.health_color,
+                "params": {},
                 "description": "Health-based color",
             },
             {
                 "text": "SUNSET WAVE",
-                "func": lambda: ColorEffects.wave(
-                    speed=1.0,
-                    colors=[
+                "func": ColorEffects.wave,
+                "params": {
+                    "speed": 1.0,
+                    "colors": [
                         (255, 100, 0),
                         (255, 200, 0),
                         (255, 255, 100),
                         (255, 150, 50),
                     ],
-                ),
+                },
                 "description": "Sunset colors wave",
             },
             {
                 "text": "FOREST WAVE",
-                "func": lambda: ColorEffects.wave(
-                    speed=1.2,
-                    colors=[(0, 100, 0), (50, 150, 50), (100, 200, 100), (0, 255, 0)],
-                ),
+                "func": ColorEffects.wave,
+                "params": {
+                    "speed": 1.2,
+                    "colors": [(0, 100, 0), (50, 150, 50), (100, 200, 100), (0, 255, 0)],
+                },
                 "description": "Forest colors wave",
             },
             {
                 "text": "CYBER PULSE",
-                "func": lambda: ColorEffects.pulse(
-                    speed=2.5,
-                    base_color=(0, 50, 100),
-                    target_color=(0, 255, 255),
-                    intensity=0.9,
-                ),
+                "func": ColorEffects.pulse,
+                "params": {
+                    "speed": 2.5,
+                    "base_color": (0, 50, 100),
+                    "target_color": (0, 255, 255),
+                    "intensity": 0.9,
+                },
                 "description": "Cyberpunk cyan pulse",
             },
             {
                 "text": "LAVA BREATHING",
-                "func": lambda: ColorEffects.breathing(
-                    speed=0.4, base_color=(200, 50, 0), intensity=0.8
-                ),
+                "func": ColorEffects.breathing,
+                "params": {"speed": 0.4, "base_color": (200, 50, 0), "intensity": 0.8},
                 "description": "Lava breathing effect",
             },
         ]
@@ -237,158 +262,220 @@ class ColorTextDemo:
             # Create main text sprite
             text_sprite = s.TextSprite(effect["text"], 24, (255, 255, 255), (x, y))
 
-            # Create description text
-            desc_sprite = s.TextSprite(effect["description"], 14, (150, 150, 150), (x, y + 30))
+            # Description never changes: rendered once and baked into the static layer
+            desc_sprite = s.TextSprite(
+                effect["description"], 14, (150, 150, 150), (x, y + 30), auto_register=False
+            )
+            self.static_texts.append(desc_sprite)
 
             # Create RGB info text
             rgb_sprite = s.TextSprite("RGB: (255, 255, 255)", 12, (100, 100, 100), (x, y + 50))
 
-            self.text_effects.append(
-                {
-                    "text_sprite": text_sprite,
-                    "desc_sprite": desc_sprite,
-                    "rgb_sprite": rgb_sprite,
-                    "effect_func": effect["func"],
-                    "original_text": effect["text"],
-                    "is_dynamic": "TEMPERATURE" in effect["text"] or "HEALTH" in effect["text"],
-                }
-            )
+            self.effect_names.append(effect["text"])
+            # The effect function with its parameters bound once (functools.partial
+            # is implemented in C): per frame only the timestamp is passed in
+            self.effect_funcs.append(partial(effect["func"], **effect["params"]))
+            self.effect_text_sprites.append(text_sprite)
+            self.effect_rgb_sprites.append(rgb_sprite)
+
+        # Value-driven texts are looked up once here, not scanned for by name every frame
+        for name, text_sprite in zip(self.effect_names, self.effect_text_sprites):
+            if name.startswith("TEMPERATURE"):
+                self.temperature_text = text_sprite
+            elif name.startswith("HEALTH"):
+                self.health_text = text_sprite
+
+        # Last color shown by each effect, to skip unchanged frames
+        self.effect_last_colors = [None] * len(self.effect_funcs)
+
+    def temperature_color(self, now=None):
+        """Color of the temperature text; depends on the value, not on time."""
+        return ColorEffects.temperature(self.temperature, 0, 100)
+
+    def health_color(self, now=None):
+        """Color of the health text; depends on the value, not on time."""
+        return ColorEffects.health_bar(self.health, 100)
 
     def update_dynamic_values(self):
         """Update health and temperature for dynamic effects."""
-        # Update health (bouncing between 0 and 100)
-        self.health += self.health_direction * 30 * s.dt
-        if self.health <= 0:
-            self.health = 0
-            self.health_direction = 1
-        elif self.health >= 100:
-            self.health = 100
-            self.health_direction = -1
-
-        # Update temperature (bouncing between 0 and 100)
-        self.temperature += self.temp_direction * 25 * s.dt
-        if self.temperature <= 0:
-            self.temperature = 0
-            self.temp_direction = 1
-        elif self.temperature >= 100:
-            self.temperature = 100
-            self.temp_direction = -1
+        # Triangle waves over the effect time bounce both values between 0 and 100
+        # (health at 30 units/s, temperature at 25 units/s) without direction state.
+        # Computed from the tick clock each frame, so no float error accumulates.
+        effect_time = (pygame.time.get_ticks() - self.effect_start_ms) / 1000.0
+        self.health = abs((effect_time * 0.3) % 2 - 1) * 100
+        self.temperature = abs((effect_time * 0.25 + 1.5) % 2 - 1) * 100
+
+        # Labels show whole numbers: reformat only when the rounded value changes
+        health_shown = round(self.health)
+        temp_shown = round(self.temperature)
+        if (health_shown, temp_shown) == self.shown_values:
+            return
+        self.shown_values = (health_shown, temp_shown)
 
         # Update text for dynamic effects
-        for effect in self.text_effects:
-            if effect["is_dynamic"]:
-                if "TEMPERATURE" in effect["original_text"]:
-                    effect["text_sprite"].set_text(f"TEMPERATURE: {self.temperature:.0f}°C")
-                elif "HEALTH" in effect["original_text"]:
-                    effect["text_sprite"].set_text(f"HEALTH: {self.health:.0f}%")
-
-    def update_text_colors(self):
+        self.temperature_text.set_text(f"TEMPERATURE: {temp_shown}°C")
+        self.health_text.set_text(f"HEALTH: {health_shown}%")
+
+    def update_text_colors(self, now):
         """Update all text colors with their respective effects."""
-        for effect in self.text_effects:
+        last_colors = self.effect_last_colors
+        for i, (effect_func, text_sprite, rgb_sprite) in enumerate(
+            zip(self.effect_funcs, self.effect_text_sprites, self.effect_rgb_sprites)
+        ):
             try:
                 # Get current color from effect function
-                color = effect["effect_func"]()
+                color = effect_func(now=now)
+
+                # Strobes, flickers and value-based colors often repeat the previous
+                # frame's color: nothing to recolor or reformat then
+                if color == last_colors[i]:
+                    continue
+                last_colors[i] = color
 
                 # Update text color
-                effect["text_sprite"].set_color(color)
+                text_sprite.set_color(color)
 
                 # Update RGB info
-                effect["rgb_sprite"].set_text(f"RGB: {color}")
+                rgb_sprite.set_text(f"RGB: {color}")
 
             except Exception as e:
                 # Fallback to white if there's an error
-                effect["text_sprite"].set_color((255, 255, 255))
-                effect["rgb_sprite"].set_text(f"Error: {str(e)[:15]}")
+                last_colors[i] = None
+                text_sprite.set_color((255, 255, 255))
+                rgb_sprite.set_text(f"Error: {str(e)[:15]}")
+
+    def setup_static_labels(self):
+        """Create header and category labels once; only their colors change per frame."""
+        self.title_sprite = s.TextSprite(
+            "Color Text Effects Demo", 48, (255, 255, 255), (700, 30), auto_register=False
+        )
+        self.static_texts.append(
+            s.TextSprite(
+                "Dynamic Color Effects Applied to Text",
+                20,
+                (200, 200, 200),
+                (700, 60),
+                auto_register=False,
+            )
+        )
+
+        # All texts with constant color and content go into one surface:
+        # one blit per frame instead of a separate draw for each label
+        self.static_layer = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA).convert_alpha()
+        for text in self.static_texts:
+            self.static_layer.blit(text.image, text.rect)
+
+        categories = [
+            (
+                "Pulse Effects",
+                (200, 80),
+                lambda now: ColorEffects.pulse(
+                    speed=1.0, base_color=(255, 100, 100), target_color=(255, 200, 200), now=now
+                ),
+            ),
+            (
+                "Rainbow & Wave",
+                (550, 80),
+                lambda now: ColorEffects.rainbow(speed=2.0, saturation=0.7, now=now),
+            ),
+            (
+                "Breathing & Flicker",
+                (900, 80),
+                lambda now: ColorEffects.breathing(speed=0.8, base_color=(100, 255, 100), now=now),
+            ),
+        ]
+        self.category_labels = [
+            (s.TextSprite(category, 20, color_func(None), pos, auto_register=False), color_func)
+            for category, pos, color_func in categories
+        ]
 
-    def draw_header(self):
+    def draw_header(self, now):
         """Draw title and instructions."""
         # Main title with rainbow effect
-        title_color = ColorEffects.rainbow(speed=0.5, saturation=0.8)
-        title = s.TextSprite("Color Text Effects Demo", 48, title_color, (700, 30))
-        title.update(self.screen)
+        title_color = ColorEffects.rainbow(speed=0.5, saturation=0.8, now=now)
+        if title_color != self.title_sprite.color:
+            self.title_sprite.set_color(title_color)
+        self.title_sprite.update(self.screen)
 
-        # Subtitle
-        subtitle = s.TextSprite(
-            "Dynamic Color Effects Applied to Text", 20, (200, 200, 200), (700, 60)
-        )
-        subtitle.update(self.screen)
+        # Subtitle and effect descriptions
+        self.screen.blit(self.static_layer, (0, 0))
 
-    def draw_instructions(self):
-        """Draw instructions at the bottom."""
+    def setup_info_labels(self):
+        """Create instruction and performance labels once; per frame only colors and values change."""
         instructions = [
             "Each text demonstrates a different color effect from the SpritePro color_effects module",
             "Temperature and Health texts update dynamically to show value-based color mapping",
             "Press ESC to exit, SPACE to pause/resume effects",
             "All effects are applied in real-time to TextSprite objects",
         ]
+        self.instruction_sprites = [
+            s.TextSprite(instruction, 16, (100, 100, 100), (700, 820 + i * 20), auto_register=False)
+            for i, instruction in enumerate(instructions)
+        ]
 
-        for i, instruction in enumerate(instructions):
-            color = ColorEffects.pulse(
-                speed=0.5,
-                base_color=(100, 100, 100),
-                target_color=(200, 200, 200),
-                offset=i * 0.5,
+        self.fps_sprite = s.TextSprite("FPS: 0", 18, (0, 255, 0), (1300, 20), auto_register=False)
+        self.last_fps = None
+        self.count_sprite = s.TextSprite(
+            f"Active Text Effects: {len(self.effect_funcs)}",
+            16,
+            (0, 100, 255),
+            (1300, 45),
+            auto_register=False,
+        )
+        self.temp_sprite = s.TextSprite("", 16, (255, 255, 255), (70, 20), auto_register=False)
+        self.health_sprite = s.TextSprite("", 16, (255, 255, 255), (70, 45), auto_register=False)
+        self.pause_sprite = s.TextSprite(
+            "PAUSED - Press SPACE to resume", 32, (255, 255, 0), (700, 450), auto_register=False
+        )
+
+    def draw_instructions(self, now):
+        """Draw instructions at the bottom."""
+        for i, text in enumerate(self.instruction_sprites):
+            text.set_color(
+                ColorEffects.pulse(
+                    speed=0.5,
+                    base_color=(100, 100, 100),
+                    target_color=(200, 200, 200),
+                    offset=i * 0.5,
+                    now=now,
+                )
             )
-            text = s.TextSprite(instruction, 16, color, (700, 820 + i * 20))
             text.update(self.screen)
 
-    def draw_performance_info(self):
+    def draw_performance_info(self, now):
         """Draw performance information."""
-        # FPS counter with breathing effect
-        fps_color = ColorEffects.breathing(speed=1.0, base_color=(0, 255, 0))
-        fps_text = s.TextSprite(f"FPS: {s.clock.get_fps():.1f}", 18, fps_color, (1300, 20))
-        fps_text.update(self.screen)
+        # FPS counter with breathing effect: the text changes only with the whole FPS value
+        fps = round(s.clock.get_fps())
+        if fps != self.last_fps:
+            self.last_fps = fps
+            self.fps_sprite.set_text(f"FPS: {fps}")
+        self.fps_sprite.set_color(
+            ColorEffects.breathing(speed=1.0, base_color=(0, 255, 0), now=now)
+        )
+        self.fps_sprite.update(self.screen)
 
         # Effect count with pulse
-        count_color = ColorEffects.pulse(
-            speed=1.5, base_color=(0, 100, 255), target_color=(100, 200, 255)
-        )
-        count_text = s.TextSprite(
-            f"Active Text Effects: {len(self.text_effects)}",
-            16,
-            count_color,
-            (1300, 45),
+        self.count_sprite.set_color(
+            ColorEffects.pulse(
+                speed=1.5, base_color=(0, 100, 255), target_color=(100, 200, 255), now=now
+            )
         )
-        count_text.update(self.screen)
+        self.count_sprite.update(self.screen)
 
         # Dynamic values display
-        temp_color = ColorEffects.temperature(self.temperature, 0, 100)
-        temp_display = s.TextSprite(
-            f"Current Temp: {self.temperature:.1f}°C", 16, temp_color, (70, 20)
-        )
-        temp_display.update(self.screen)
+        self.temp_sprite.set_text(f"Current Temp: {self.temperature:.1f}°C")
+        self.temp_sprite.set_color(ColorEffects.temperature(self.temperature, 0, 100))
+        self.temp_sprite.update(self.screen)
 
-        health_color = ColorEffects.health_bar(self.health, 100)
-        health_display = s.TextSprite(
-            f"Current Health: {self.health:.1f}%", 16, health_color, (70, 45)
-        )
-        health_display.update(self.screen)
+        self.health_sprite.set_text(f"Current Health: {self.health:.1f}%")
+        self.health_sprite.set_color(ColorEffects.health_bar(self.health, 100))
+        self.health_sprite.update(self.screen)
 
-    def draw_color_categories(self):
+    def draw_color_categories(self, now):
         """Draw category labels."""
-        categories = [
-            (
-                "Pulse Effects",
-                (200, 80),
-                ColorEffects.pulse(
-                    speed=1.0, base_color=(255, 100, 100), target_color=(255, 200, 200)
-                ),
-            ),
-            (
-                "Rainbow & Wave",
-                (550, 80),
-                ColorEffects.rainbow(speed=2.0, saturation=0.7),
-            ),
-            (
-                "Breathing & Flicker",
-                (900, 80),
-                ColorEffects.breathing(speed=0.8, base_color=(100, 255, 100)),
-            ),
-        ]
-
-        for category, pos, color in categories:
-            text = s.TextSprite(category, 20, color, pos)
-            text.update(self.screen)
+        for label, color_func in self.category_labels:
+            label.set_color(color_func(now))
+            label.update(self.screen)
 
     def run(self):
         """Main demo loop."""
@@ -396,46 +483,50 @@ class ColorTextDemo:
         paused = False
 
         while running:
+            # One timestamp per frame: every effect, labels included, is evaluated
+            # at the same moment instead of each call sampling time.time() itself
+            now = time.time()
+
             if s.input.was_pressed(pygame.K_ESCAPE):
                 running = False
             elif s.input.was_pressed(pygame.K_SPACE):
                 paused = not paused
+                if paused:
+                    self.paused_at_ms = pygame.time.get_ticks()
+                else:
+                    self.effect_start_ms += pygame.time.get_ticks() - self.paused_at_ms
 
             if not paused:
                 # Update dynamic values
                 self.update_dynamic_values()
 
                 # Update all text colors
-                self.update_text_colors()
+                self.update_text_colors(now)
 
             # Clear screen with dark background
             self.screen.fill((15, 15, 25))
 
             # Draw header
-            self.draw_header()
+            self.draw_header(now)
 
             # Draw category labels
-            self.draw_color_categories()
+            self.draw_color_categories(now)
 
-            # Draw all text effects
-            for effect in self.text_effects:
-                effect["text_sprite"].update(self.screen)
-                effect["desc_sprite"].update(self.screen)
-                effect["rgb_sprite"].update(self.screen)
+            # Effect texts and RGB labels are registered sprites: s.update() below
+            # draws them in its single sprite pass, drawing them here would do it twice
 
             # Draw instructions and info
-            self.draw_instructions()
-            self.draw_performance_info()
+            self.draw_instructions(now)
+            self.draw_performance_info(now)
 
             # Show pause state
             if paused:
-                pause_color = ColorEffects.strobe(
-                    speed=3.0, on_color=(255, 255, 0), off_color=(200, 200, 0)
-                )
-                pause_text = s.TextSprite(
-                    "PAUSED - Press SPACE to resume", 32, pause_color, (700, 450)
+                self.pause_sprite.set_color(
+                    ColorEffects.strobe(
+                        speed=3.0, on_color=(255, 255, 0), off_color=(200, 200, 0), now=now
+                    )
                 )
-                pause_text.update(self.screen)
+                self.pause_sprite.update(self.screen)
 
             # Update using SpritePro
             s.update(fps=60)
@@ -1,6 +1,5 @@
 import pygame
 import pymunk
-import pymunk.pygame_util
 import spritePro as s
 
 # Initialize Pygame and Pymunk
@@ -27,8 +26,10 @@ ball_shape = pymunk.Circle(ball_body, ball_radius)
 ball_shape.friction = 0.7
 space.add(ball_body, ball_shape)
 
-# Draw options
-draw_options = pymunk.pygame_util.DrawOptions(screen)
+# Static scene (background and ground) is drawn once; per frame only the ball is drawn
+background = pygame.Surface(screen.get_size()).convert()
+background.fill((255, 255, 255))
+pygame.draw.line(background, (60, 60, 60), ground.a, ground.b, int(ground.radius * 2))
 
 running = True
 while running:
@@ -40,11 +41,13 @@ while running:
     if s.input.was_pressed(pygame.K_ESCAPE):
         running = False
 
-    # Clear screen
-    screen.fill((255, 255, 255))
+    # Static background replaces the clear and the ground draw
+    screen.blit(background, (0, 0))
 
-    # Draw everything
-    space.debug_draw(draw_options)
+    # Ball with a radius line that shows its rotation
+    center = ball_body.position
+    pygame.draw.circle(screen, (70, 130, 180), center, ball_radius)
+    pygame.draw.line(screen, (20, 40, 60), center, ball_body.local_to_world((ball_radius, 0)), 2)
 
     # Update physics
     space.step(1 / 60.0)
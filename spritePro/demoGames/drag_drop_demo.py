@@ -41,6 +41,7 @@ class DragDropScene(s.Scene):
         self.slot_right.set_color((50, 60, 90))
         self.slot_left_label = s.TextSprite("Slot A", 18, (180, 180, 200), (220, 300), scene=self)
         self.slot_right_label = s.TextSprite("Slot B", 18, (180, 180, 200), (580, 300), scene=self)
+        self.slots = (self.slot_left, self.slot_right)
 
         self.box = s.DraggableSprite(
             "",
@@ -81,11 +82,9 @@ class DragDropScene(s.Scene):
         return False
 
     def _get_drop_target(self, sprite: s.DraggableSprite):
-        if sprite.rect.colliderect(self.slot_left.rect):
-            return self.slot_left
-        if sprite.rect.colliderect(self.slot_right.rect):
-            return self.slot_right
-        return None
+        # Один проход collidelist по всем слотам вместо цепочки colliderect
+        index = sprite.rect.collidelist([slot.rect for slot in self.slots])
+        return self.slots[index] if index != -1 else None
 
 
 def run_demo(platform: str = "pygame") -> None:
@@ -51,9 +51,9 @@ class Btn_skin(s.Button):
             score = money.value
             skin_id = self.id
             price_skins[self.id] = 0
-            s.PlayerPrefs._set_value("price_skins", price_skins)
-            s.PlayerPrefs.set_int("score", score)
-            s.PlayerPrefs.set_int("skin_id", skin_id)
+            s.PlayerPrefs.set_values(
+                {"price_skins": price_skins, "score": score, "skin_id": skin_id}
+            )
 
 
 def onclick():
@@ -61,7 +61,6 @@ def onclick():
     score += click
     money.add(click)
     s.PlayerPrefs.set_int("score", score)
-    emitter.set_position(s.WH_C)
     emitter.emit()
 
 
@@ -70,19 +69,27 @@ def use_skin(sprite):
     player.set_image(s.utils.round_corners(player.image, 5000))
 
 
-def go_game():
+def set_game_state(state):
+    """Переключает экран: активность спрайтов и цвет фона меняются только при смене состояния."""
     global game_state
-    game_state = GAME
+    game_state = state
+    for sprite_state, sprites in state_sprites.items():
+        for sprite in sprites:
+            sprite.set_active(sprite_state == state)
+    btn_go_back.set_active(state != GAME)
+    bg.set_color(state_bg_colors[state])
+
+
+def go_game():
+    set_game_state(GAME)
 
 
 def go_shop():
-    global game_state
-    game_state = SHOP
+    set_game_state(SHOP)
 
 
 def go_upgrade():
-    global game_state
-    game_state = UPGRADE
+    set_game_state(UPGRADE)
 
 
 skin_id = s.PlayerPrefs.get_int("skin_id", 0)
@@ -130,6 +137,8 @@ emitter = s.ParticleEmitter(
         spawn_circle_radius=100,
     )
 )
+# Частицы всегда летят из центра экрана — позицию задаём один раз
+emitter.set_position(s.WH_C)
 
 player = s.Button(sprite_skins[skin_id], (500, 500), s.WH_C, "", on_click=onclick)
 
@@ -166,39 +175,37 @@ for i, e in enumerate(sprite_skins):
     skin = Btn_skin(e, size, (200, 200), text_size=56, text_color=(255, 0, 255))
     skin.init(i, use_skin)
     skin.text_sprite.set_position((skin.rect.centerx, skin.rect.y), s.Anchor.MID_BOTTOM)
-    x = i % 2
-    y = i // 2
-    skin.set_position((x_start + grid_space * x, y_start + grid_space * y))
+    row, col = divmod(i, 2)
+    skin.set_position((x_start + grid_space * col, y_start + grid_space * row))
     btn_skins.append(skin)
 
-sprites_game = [player, btn_go_shop]
-sprites_shop = [btn_go_upgrade] + btn_skins
-sprites_upgrade = [btn_upgrade]
+state_sprites = {
+    GAME: [player, btn_go_shop],
+    SHOP: [btn_go_upgrade] + btn_skins,
+    UPGRADE: [btn_upgrade],
+}
+state_bg_colors = {
+    GAME: (100, 100, 100),
+    SHOP: (255, 255, 255),
+    UPGRADE: (100, 100, 255),
+}
+set_game_state(game_state)
+shown_score = None
+shown_color = None
 
 
 # Main game loop
 while True:
     s.update()
 
-    text.text = str(score)
+    if score != shown_score:
+        text.text = str(score)
+        shown_score = score
     emitter.config.image = player.image
     emitter.config.amount = click
 
-    btn_go_back.set_active(game_state != GAME)
-    text.set_color(s.utils.ColorEffects.strobe(15, (255, 0, 0), (150, 0, 0), 0.9))
-
-    for sprite in sprites_game:
-        sprite.set_active(game_state == GAME)
-
-    for sprite in sprites_shop:
-        sprite.set_active(game_state == SHOP)
-
-    for spite in sprites_upgrade:
-        spite.set_active(game_state == UPGRADE)
-
-    if game_state == GAME:
-        bg.set_color((100, 100, 100))
-    elif game_state == SHOP:
-        bg.set_color((255, 255, 255))
-    elif game_state == UPGRADE:
-        bg.set_color((100, 100, 255))
+    # strobe возвращает один из двух цветов — перекрашиваем только на переключении
+    strobe_color = s.utils.ColorEffects.strobe(15, (255, 0, 0), (150, 0, 0), 0.9)
+    if strobe_color != shown_color:
+        text.set_color(strobe_color)
+        shown_color = strobe_color
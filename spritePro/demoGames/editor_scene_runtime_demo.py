@@ -22,6 +22,11 @@ import spritePro as s
 
 SCENE_PATH = project_root / "spritePro" / "editor" / "assets" / "New Scene.json"
 
+LEFT_KEYS = (pygame.K_a, pygame.K_LEFT)
+RIGHT_KEYS = (pygame.K_d, pygame.K_RIGHT)
+UP_KEYS = (pygame.K_w, pygame.K_UP)
+DOWN_KEYS = (pygame.K_s, pygame.K_DOWN)
+
 
 class RuntimeSceneDemo(s.Scene):
     def __init__(self, scene_path: Path):
@@ -31,6 +36,14 @@ class RuntimeSceneDemo(s.Scene):
         self.player = runtime.first("amogus")
         self.clones = runtime.startswith("amogus (")
         self.background = runtime.first("background_game")
+        # Данные клонов — параллельными списками, чтобы цикл кадра не ходил по атрибутам.
+        # Фаза волны клона i постоянна: sin(a + i) = sin(a)cos(i) + cos(a)sin(i)
+        count = len(self.clones)
+        self._clone_sprites = [obj.sprite for obj in self.clones]
+        self._clone_base_y = [obj.base_position.y for obj in self.clones]
+        self._clone_spin = [35 + 10 * i for i in range(count)]
+        self._clone_sin = [math.sin(i) for i in range(count)]
+        self._clone_cos = [math.cos(i) for i in range(count)]
 
     def update(self, dt: float) -> None:
         self._update_player(dt)
@@ -41,36 +54,42 @@ class RuntimeSceneDemo(s.Scene):
         if self.player is None:
             return
         sp = self.player.sprite
-        speed = 420.0
+        step = 420.0 * dt
         keys = pygame.key.get_pressed()
 
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            sp.rect.x -= speed * dt
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            sp.rect.x += speed * dt
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            sp.rect.y -= speed * dt
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            sp.rect.y += speed * dt
-        if keys[pygame.K_q]:
-            sp.angle -= 120.0 * dt
-        if keys[pygame.K_e]:
-            sp.angle += 120.0 * dt
+        dx = any(keys[k] for k in RIGHT_KEYS) - any(keys[k] for k in LEFT_KEYS)
+        dy = any(keys[k] for k in DOWN_KEYS) - any(keys[k] for k in UP_KEYS)
+        if dx:
+            sp.rect.x += dx * step
+        if dy:
+            sp.rect.y += dy * step
+        turn = keys[pygame.K_e] - keys[pygame.K_q]
+        if turn:
+            sp.angle += turn * 120.0 * dt
 
     def _update_clones(self, dt: float) -> None:
         t = s.time_since_start
-        for i, obj in enumerate(self.clones):
-            sp = obj.sprite
-            sp.angle += (35 + 10 * i) * dt
-            sp.rect.centery = int(obj.base_position.y + math.sin((t * 2.0) + i) * 16.0)
+        sin_t = math.sin(t * 2.0)
+        cos_t = math.cos(t * 2.0)
+        for sp, base_y, spin, sin_i, cos_i in zip(
+            self._clone_sprites,
+            self._clone_base_y,
+            self._clone_spin,
+            self._clone_sin,
+            self._clone_cos,
+        ):
+            sp.angle += spin * dt
+            sp.rect.centery = int(base_y + (sin_t * cos_i + cos_t * sin_i) * 16.0)
 
     def _update_background(self) -> None:
         if self.background is None:
             return
         cam = s.get_camera_position()
-        bg = self.background.sprite
-        bg.rect.centerx = int(self.background.base_position.x + cam.x * 0.08)
-        bg.rect.centery = int(self.background.base_position.y + cam.y * 0.08)
+        base = self.background.base_position
+        self.background.sprite.rect.center = (
+            int(base.x + cam.x * 0.08),
+            int(base.y + cam.y * 0.08),
+        )
 
 
 def run_demo(duration: float | None = None) -> None:
@@ -33,9 +33,13 @@ class EventBusDemoScene(s.Scene):
         )
 
         self.state = {"ticks": 0}
+        # Сигналы пользовательских событий берём один раз: send() по сигналу
+        # не ищет имя в реестре EventBus на каждом вызове
+        self.timer_tick = s.events.get_event("timer_tick")
+        self.custom_event = s.events.get_event("custom_event")
         self.timer = s.Timer(
             1.0,
-            callback=lambda: s.events.send("timer_tick"),
+            callback=self.timer_tick.send,
             repeat=True,
             autostart=False,
         )
@@ -46,8 +50,8 @@ class EventBusDemoScene(s.Scene):
         s.events.connect(s.globalEvents.KEY_UP, self.on_key_up)
         s.events.connect(s.globalEvents.MOUSE_DOWN, self.on_mouse_down)
         s.events.connect(s.globalEvents.MOUSE_UP, self.on_mouse_up)
-        s.events.connect("timer_tick", self.on_timer_tick)
-        s.events.connect("custom_event", self.on_custom_event)
+        self.timer_tick.connect(self.on_timer_tick)
+        self.custom_event.connect(self.on_custom_event)
         s.events.connect(s.globalEvents.QUIT, self.on_quit)
 
     def show(self, text: str) -> None:
@@ -65,7 +69,7 @@ class EventBusDemoScene(s.Scene):
             self.show("Timer stopped")
             return
         if key == pygame.K_c:
-            s.events.send("custom_event", message="Привет из EventBus!")
+            self.custom_event.send(message="Привет из EventBus!")
             return
         if key == pygame.K_l:
             self.local_event.send(value=self.state["ticks"])
@@ -30,16 +30,20 @@ CHOICES = {
 }
 
 
+RPS_CHOICE = "rps_choice"
+
+# Кого побеждает каждый выбор
+BEATS = {
+    "rock": "scissors",
+    "scissors": "paper",
+    "paper": "rock",
+}
+
+
 def _resolve_winner(left: str, right: str) -> int:
     if left == right:
         return 0
-    if (left, right) in (
-        ("rock", "scissors"),
-        ("scissors", "paper"),
-        ("paper", "rock"),
-    ):
-        return 1
-    return -1
+    return 1 if BEATS.get(left) == right else -1
 
 
 class EventsRpsScene(s.Scene):
@@ -69,7 +73,9 @@ class EventsRpsScene(s.Scene):
         self.other_id: int | None = None
         self.last_result_at: float | None = None
         self.result_delay = 1.0
-        s.events.connect("rps_choice", self.on_choice)
+        # Сигнал берём один раз: и ввод, и входящие сообщения шлют через него
+        self.rps_choice = s.events.get_event(RPS_CHOICE)
+        self.rps_choice.connect(self.on_choice)
 
     def on_choice(self, choice: str, sender_id: int | None = None) -> None:
         if self.last_result_at is not None:
@@ -97,8 +103,7 @@ class EventsRpsScene(s.Scene):
         if self.last_result_at is None:
             for key, choice in CHOICES.items():
                 if s.input.was_pressed(key):
-                    s.events.send(
-                        "rps_choice",
+                    self.rps_choice.send(
                         route="all",
                         net=self.ctx,
                         choice=choice,
@@ -106,8 +111,8 @@ class EventsRpsScene(s.Scene):
                     )
 
         for msg in self.ctx.poll():
-            if msg.get("event") == "rps_choice":
-                s.events.send("rps_choice", **msg.get("data", {}))
+            if msg.get("event") == RPS_CHOICE:
+                self.rps_choice.send(**msg.get("data", {}))
 
         self.my_info.set_text(f"You (ID: {self.ctx.client_id})")
         other_id_label = "?" if self.other_id is None else str(self.other_id)
@@ -126,7 +131,6 @@ class EventsRpsScene(s.Scene):
         self.other_choice_text.set_text(self.other_choice or "?")
         self.score_text.set_text(f"Score: {self.my_score} - {self.other_score}")
 
-
 def multiplayer_main(net: s.NetClient, role: str) -> None:
     s.run(
         scene=lambda: EventsRpsScene(net, role),
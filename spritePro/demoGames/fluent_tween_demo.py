@@ -47,6 +47,35 @@ class FluentTweenDemoScene(s.Scene):
         self.active_loop_handle = None
         self.active_kill_handle = None
 
+        # Таблица клавиша -> действие собирается один раз
+        box = self.box
+        self.key_handlers = {
+            pygame.K_1: lambda: box.DoMove((700, 300), 1.2),
+            pygame.K_2: lambda: box.DoMoveBy((80, -60), 0.8),
+            pygame.K_3: lambda: box.DoScale(1.6, 0.6),
+            pygame.K_4: lambda: box.DoRotateBy(180, 0.8),
+            pygame.K_5: lambda: box.DoColor((255, 120, 120), 0.7),
+            pygame.K_6: lambda: box.DoFadeOut(0.5).OnComplete(lambda: box.DoFadeIn(0.5)),
+            pygame.K_7: lambda: (
+                box.DoMove((250, 400), 1.0)
+                .SetEase(s.Ease.OutCubic)
+                .SetDelay(0.3)
+                .OnComplete(lambda: None)
+            ),
+            pygame.K_8: lambda: self._restart_loop(
+                lambda: self.box_loop.DoScale(1.5, 0.8).SetLoops(-1).SetYoyo(True)
+            ),
+            pygame.K_9: lambda: self._restart_loop(
+                lambda: self.box_loop.DoMove((450, 450), 1.2).SetLoops(-1)
+            ),
+            pygame.K_0: lambda: self._restart_loop(
+                lambda: self.box_loop.DoMove((450, 450), 1.2).SetLoops(-1).SetYoyo(True)
+            ),
+            pygame.K_k: self._start_kill_demo,
+            pygame.K_l: self._kill_complete,
+            pygame.K_z: self.reset,
+        }
+
     def reset(self) -> None:
         if self.active_loop_handle:
             self.active_loop_handle.Kill(complete=False)
@@ -65,58 +94,27 @@ class FluentTweenDemoScene(s.Scene):
         ).set_alpha(255)
 
     def update(self, dt: float) -> None:
-        if s.input.was_pressed(pygame.K_1):
-            self.box.DoMove((700, 300), 1.2)
-        if s.input.was_pressed(pygame.K_2):
-            self.box.DoMoveBy((80, -60), 0.8)
-        if s.input.was_pressed(pygame.K_3):
-            self.box.DoScale(1.6, 0.6)
-        if s.input.was_pressed(pygame.K_4):
-            self.box.DoRotateBy(180, 0.8)
-        if s.input.was_pressed(pygame.K_5):
-            self.box.DoColor((255, 120, 120), 0.7)
-        if s.input.was_pressed(pygame.K_6):
-            self.box.DoFadeOut(0.5).OnComplete(lambda: self.box.DoFadeIn(0.5))
-
-        if s.input.was_pressed(pygame.K_7):
-            self.box.DoMove((250, 400), 1.0).SetEase(s.Ease.OutCubic).SetDelay(0.3).OnComplete(
-                lambda: None
-            )
-
-        if s.input.was_pressed(pygame.K_8):
-            if self.active_loop_handle:
-                self.active_loop_handle.Kill(complete=False)
-            self.box_loop.set_position(self.base_pos_loop)
-            self.box_loop.set_scale(1.0)
-            self.active_loop_handle = self.box_loop.DoScale(1.5, 0.8).SetLoops(-1).SetYoyo(True)
-
-        if s.input.was_pressed(pygame.K_9):
-            if self.active_loop_handle:
-                self.active_loop_handle.Kill(complete=False)
-            self.box_loop.set_position(self.base_pos_loop)
-            self.box_loop.set_scale(1.0)
-            self.active_loop_handle = self.box_loop.DoMove((450, 450), 1.2).SetLoops(-1)
-
-        if s.input.was_pressed(pygame.K_0):
-            if self.active_loop_handle:
-                self.active_loop_handle.Kill(complete=False)
-            self.box_loop.set_position(self.base_pos_loop)
-            self.box_loop.set_scale(1.0)
-            self.active_loop_handle = (
-                self.box_loop.DoMove((450, 450), 1.2).SetLoops(-1).SetYoyo(True)
-            )
-
-        if s.input.was_pressed(pygame.K_k):
-            if self.active_kill_handle:
-                self.active_kill_handle.Kill(complete=False)
-            self.active_kill_handle = self.box_kill.DoMove((700, 450), 1.5)
-        if s.input.was_pressed(pygame.K_l):
-            if self.active_kill_handle:
-                self.active_kill_handle.Kill(complete=True)
-                self.active_kill_handle = None
-
-        if s.input.was_pressed(pygame.K_z):
-            self.reset()
+        was_pressed = s.input.was_pressed
+        for key, handler in self.key_handlers.items():
+            if was_pressed(key):
+                handler()
+
+    def _restart_loop(self, start_tween) -> None:
+        if self.active_loop_handle:
+            self.active_loop_handle.Kill(complete=False)
+        self.box_loop.set_position(self.base_pos_loop)
+        self.box_loop.set_scale(1.0)
+        self.active_loop_handle = start_tween()
+
+    def _start_kill_demo(self) -> None:
+        if self.active_kill_handle:
+            self.active_kill_handle.Kill(complete=False)
+        self.active_kill_handle = self.box_kill.DoMove((700, 450), 1.5)
+
+    def _kill_complete(self) -> None:
+        if self.active_kill_handle:
+            self.active_kill_handle.Kill(complete=True)
+            self.active_kill_handle = None
 
 
 def main() -> None:
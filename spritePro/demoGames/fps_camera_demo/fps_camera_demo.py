@@ -21,6 +21,9 @@ sys.path.insert(0, str(parent_dir))
 import pygame
 import spritePro as s
 
+BACKGROUND_COLOR = (20, 20, 30)
+SQUARE_SIZE = 80
+
 
 class FPSCameraDemo:
     def __init__(self):
@@ -47,6 +50,8 @@ class FPSCameraDemo:
         self.camera_text = s.TextSprite("Camera: (0, 0)", font_size=18)
         self.camera_text.set_position((10, 40), anchor=s.Anchor.TOP_LEFT)
         self.camera_text.set_screen_space(True)
+        self.shown_camera = (0, 0)
+        self.camera_text_time = 0.0
 
         # Instructions text
         instructions = s.TextSprite(
@@ -58,16 +63,26 @@ class FPSCameraDemo:
 
     def create_world_objects(self):
         """Create background sprites to demonstrate camera movement."""
-        # Create a grid of colored squares as sprites
-        for x in range(-500, 1500, 100):
-            for y in range(-300, 1000, 100):
+        # The grid of colored squares never changes, so it is baked once into a
+        # single surface: one sprite and one blit per frame instead of ~260.
+        xs = range(-500, 1500, 100)
+        ys = range(-300, 1000, 100)
+        half = SQUARE_SIZE // 2
+        left, top = xs[0] - half, ys[0] - half
+        world = pygame.Surface(
+            (xs[-1] - xs[0] + SQUARE_SIZE, ys[-1] - ys[0] + SQUARE_SIZE)
+        ).convert()
+        world.fill(BACKGROUND_COLOR)
+        for x in xs:
+            for y in ys:
                 color = (
                     random.randint(50, 200),
                     random.randint(50, 200),
                     random.randint(50, 200),
                 )
-                square = s.Sprite("", size=(80, 80), pos=(x, y))
-                square.image.fill(color)
+                world.fill(color, (x - half - left, y - half - top, SQUARE_SIZE, SQUARE_SIZE))
+        world_rect = world.get_rect(topleft=(left, top))
+        s.Sprite(world, size=world_rect.size, pos=world_rect.center)
 
         # Create some text labels in the world
         origin_text = s.TextSprite(
@@ -87,9 +102,15 @@ class FPSCameraDemo:
             # Update camera using the built-in processor
             s.process_camera_input(speed=500)
 
-            # Update UI text with current camera position
-            cam_pos = s.get_camera_position()
-            self.camera_text.set_text(f"Camera: ({cam_pos.x:.0f}, {cam_pos.y:.0f})")
+            # Update UI text with current camera position: at most as often as
+            # the FPS counter refreshes, and only when the rounded position changes
+            if s.time_since_start - self.camera_text_time >= self.fps_counter.update_interval:
+                cam_pos = s.get_camera_position()
+                shown = (round(cam_pos.x), round(cam_pos.y))
+                if shown != self.shown_camera:
+                    self.shown_camera = shown
+                    self.camera_text_time = s.time_since_start
+                    self.camera_text.set_text(f"Camera: ({shown[0]}, {shown[1]})")
 
             # The FPS counter from readySprites updates its text automatically
             # when we call its update_fps method.
@@ -97,7 +118,7 @@ class FPSCameraDemo:
 
             # The main update call handles drawing all registered sprites
             # (respecting camera offsets and screen space) and updates the display.
-            s.update(fill_color=(20, 20, 30))
+            s.update(fill_color=BACKGROUND_COLOR)
 
             if s.input.was_pressed(pygame.K_ESCAPE):
                 running = False
@@ -23,6 +23,8 @@ BOUNCE_COLORS = [
 ]
 
 MAX_SPEED = 1500.0
+# Ограничение скорости сравнивается по квадрату: корень нужен только при превышении
+MAX_SPEED_SQ = MAX_SPEED * MAX_SPEED
 
 
 class HoopConstraint:
@@ -63,12 +65,12 @@ class HoopConstraint:
             self.ball_body.position = (new_center.x, new_center.y)
             ball.rect.center = (int(new_center.x), int(new_center.y))
             self.color_index = (self.color_index + 1) % len(self.colors)
-            ball.set_circle_shape(radius=int(self.ball_radius), color=self.colors[self.color_index])
+            ball.color = self.colors[self.color_index]
 
         v = self.ball_body.velocity
-        speed = (v.x * v.x + v.y * v.y) ** 0.5
-        if speed > MAX_SPEED and speed > 0:
-            scale = MAX_SPEED / speed
+        speed_sq = v.x * v.x + v.y * v.y
+        if speed_sq > MAX_SPEED_SQ:
+            scale = MAX_SPEED / speed_sq**0.5
             self.ball_body.velocity = Vector2(v.x * scale, v.y * scale)
 
 
@@ -83,7 +85,7 @@ class HoopBounceScene(s.Scene):
         self.ball_radius = 18
         size = hoop_radius * 2 + ring_width * 2
         cx, cy = size // 2, size // 2
-        ring_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        ring_surf = pygame.Surface((size, size), pygame.SRCALPHA).convert_alpha()
         pygame.draw.circle(ring_surf, (60, 60, 80), (cx, cy), hoop_radius)
         pygame.draw.circle(ring_surf, (25, 25, 35), (cx, cy), hoop_radius - ring_width)
         hoop = s.Sprite("", pos=center, size=(size, size), scene=self)
@@ -92,7 +94,10 @@ class HoopBounceScene(s.Scene):
 
         self.center = center
         self.ball = s.Sprite("", pos=center, size=(self.ball_radius * 2,) * 2, scene=self)
-        self.ball.set_circle_shape(radius=self.ball_radius, color=BOUNCE_COLORS[0])
+        # Круг рисуется один раз белым, а цвет отскока задаётся тинтом спрайта:
+        # смена цвета не перерисовывает фигуру заново
+        self.ball.set_circle_shape(radius=self.ball_radius, color=(255, 255, 255))
+        self.ball.color = BOUNCE_COLORS[0]
         self.ball.rect.center = center
 
         s.physics.set_gravity(400.0)
@@ -119,7 +124,7 @@ class HoopBounceScene(s.Scene):
             self.ball.position = self.center
             self.ball_body.set_velocity(200, -80)
             self.constraint.color_index = 0
-            self.ball.set_circle_shape(radius=self.ball_radius, color=BOUNCE_COLORS[0])
+            self.ball.color = BOUNCE_COLORS[0]
 
 
 def run_demo(platform: str = "pygame"):
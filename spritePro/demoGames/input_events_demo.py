@@ -20,6 +20,16 @@ class InputEventsDemoScene(s.Scene):
         self.player = s.Sprite("", (60, 60), (400, 300), speed=5, scene=self)
         self.player.set_color((120, 200, 255))
         self.player.angle = 0
+        # Один твин поворота на всё время жизни сцены: Q лишь перезапускает его
+        self.rotate_tween = s.Tween(
+            0,
+            90,
+            0.35,
+            easing=s.EasingType.EASE_OUT,
+            on_update=self.player.rotate_to,
+            auto_start=False,
+            scene=self,
+        )
 
         self.title = s.TextSprite(
             "Input + EventBus Demo", 28, (255, 255, 255), (400, 40), scene=self
@@ -58,20 +68,9 @@ class InputEventsDemoScene(s.Scene):
                 )
             )
         if s.input.was_pressed(pygame.K_q):
-            start_angle = self.player.angle
-            target_angle = start_angle + 90
-
-            def apply_angle(value):
-                self.player.rotate_to(value)
-
-            tween = s.Tween(
-                start_angle,
-                target_angle,
-                0.35,
-                easing=s.EasingType.EASE_OUT,
-                on_update=apply_angle,
-            )
-            tween.start()
+            self.rotate_tween.start_value = self.player.angle
+            self.rotate_tween.end_value = self.player.angle + 90
+            self.rotate_tween.reset()
 
 
 def main():
@@ -384,37 +384,6 @@ class LayoutDemoScene(s.Scene):
         self._line_path_sprite = line_path
         self._kids_line = kids_line
 
-        self._all_layout_sprites = (
-            [main_cont]
-            + zone_containers
-            + [line_path]
-            + kids_fr
-            + kids_fc
-            + kids_gr
-            + kids_h
-            + kids_v
-            + kids_c
-            + kids_line
-            + [
-                self.title,
-                self.btn_layout,
-                self.btn_align,
-                self.btn_width_minus,
-                self.btn_width_plus,
-                self.btn_rotate,
-                self.btn_move,
-                self.btn_debug_borders,
-                self.hint,
-                lbl_fr,
-                lbl_fc,
-                lbl_gr,
-                lbl_h,
-                lbl_v,
-                lbl_c,
-                lbl_ln,
-            ]
-        )
-
     def _refresh_line_zone(self):
         """Пересчитывает линию и детей LINE после сдвига/ресайза контейнера.
 
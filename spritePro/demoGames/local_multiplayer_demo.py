@@ -32,6 +32,10 @@
 """
 
 import sys
+import time
+from bisect import bisect_right
+from collections import deque
+from operator import itemgetter
 from pathlib import Path
 
 current_dir = Path(__file__).parent
@@ -42,13 +46,51 @@ import pygame  # noqa: E402
 
 import spritePro as s  # noqa: E402
 
+# Dead reckoning: вместе с позицией шлём скорость, и получатель сам продолжает
+# движение между пакетами. Новый пакет нужен, только когда скорость сменилась или
+# предсказание разошлось с реальной позицией больше чем на порог; стоя на месте —
+# редкий повтор, чтобы подключившийся позже клиент всё равно узнал, где мы.
+SEND_THRESHOLD = 1.0
+IDLE_RESEND_INTERVAL = 1.0
+# В движении повторяем пакет чаще, чем истекает MAX_EXTRAPOLATION, иначе при
+# ровном ходе получатель успевал бы остановить игрока до следующего пакета.
+MOVING_RESEND_INTERVAL = 0.25
+# Дольше этого без пакетов не экстраполируем (собеседник отвалился или лагает).
+MAX_EXTRAPOLATION = 0.5
+# Чужих игроков рисуем с задержкой, интерполируя между полученными снимками:
+# так пакеты, пришедшие неровно, не дают рывков.
+INTERP_DELAY = 0.1
+SNAPSHOT_BUFFER = 8
+
+
+def _sample_snapshots(snapshots: deque, render_t: float) -> tuple[float, float]:
+    """Позиция на момент render_t по снимкам (t, x, y, vx, vy).
+
+    Между двумя соседними снимками — линейная интерполяция, после последнего —
+    экстраполяция по его скорости, но не дальше MAX_EXTRAPOLATION.
+
+    Такая же функция есть в three_clients_move_demo.py: демо запускаются как отдельные
+    скрипты, поэтому копии держим одинаковыми и правим вместе.
+    """
+    i = bisect_right(snapshots, render_t, key=itemgetter(0))
+    if i == 0:
+        return snapshots[0][1], snapshots[0][2]
+    t0, x0, y0, vx, vy = snapshots[i - 1]
+    if i == len(snapshots):
+        ahead = min(render_t - t0, MAX_EXTRAPOLATION)
+        return x0 + vx * ahead, y0 + vy * ahead
+    t1, x1, y1, _, _ = snapshots[i]
+    alpha = (render_t - t0) / (t1 - t0)
+    return x0 + (x1 - x0) * alpha, y0 + (y1 - y0) * alpha
+
 
 class LocalMultiplayerScene(s.Scene):
     def __init__(self) -> None:
         super().__init__()
         self.ctx = s.multiplayer_ctx
         self.speed = 240.0
-        self.tick_rate = 60
+        self.tick_rate = 20
+        self.send_interval = 1.0 / self.tick_rate
         self.other_id: int | None = None
 
         self.me = s.Sprite("", (50, 50), (200, 300), scene=self)
@@ -60,8 +102,14 @@ class LocalMultiplayerScene(s.Scene):
         self.me.set_color(my_color)
         self.other.set_color(other_color)
 
-        other_pos = self.other.get_world_position()
-        self.remote_pos = [other_pos.x, other_pos.y]
+        self.remote_pos = self.other.get_world_position()
+        self.snapshots: deque = deque(maxlen=SNAPSHOT_BUFFER)
+        self.pos = self.me.get_world_position()
+        self.last_sent_pos = pygame.Vector2(self.pos)
+        self.last_sent_vel = pygame.Vector2()
+        # Сколько прошло с последней отправки; стартуем «просроченными», чтобы
+        # первая позиция ушла сразу.
+        self.since_sent = IDLE_RESEND_INTERVAL
 
         self.me_label = s.TextSprite("?", 18, (255, 255, 255), (0, 0), scene=self)
         self.other_label = s.TextSprite("?", 18, (255, 255, 255), (0, 0), scene=self)
@@ -69,29 +117,55 @@ class LocalMultiplayerScene(s.Scene):
     def update(self, dt: float) -> None:
         dx = s.input.get_axis(pygame.K_a, pygame.K_d)
         dy = s.input.get_axis(pygame.K_w, pygame.K_s)
-        pos = self.me.get_world_position()
+        # Дробную позицию храним сами: rect её округляет, и без этого
+        # фактическая скорость расходилась бы с отправленной.
+        pos = self.pos
         pos.x += dx * self.speed * dt
         pos.y += dy * self.speed * dt
         self.me.set_position(pos)
 
-        self.ctx.send_every("pos", {"pos": list(pos)}, 1.0 / self.tick_rate)
+        vel = pygame.Vector2(dx, dy) * self.speed
+        self.since_sent += dt
+        predicted = self.last_sent_pos + self.last_sent_vel * self.since_sent
+        diverged = (
+            vel != self.last_sent_vel
+            or pos.distance_squared_to(predicted) > SEND_THRESHOLD * SEND_THRESHOLD
+        )
+        if diverged:
+            interval = self.send_interval
+        elif vel:
+            interval = MOVING_RESEND_INTERVAL
+        else:
+            interval = IDLE_RESEND_INTERVAL
+        # Пакет собираем только когда действительно отправляем
+        if self.since_sent >= interval:
+            self.ctx.send("pos", {"pos": [round(pos.x, 1), round(pos.y, 1)], "vel": [vel.x, vel.y]})
+            self.last_sent_pos.update(pos)
+            self.last_sent_vel.update(vel)
+            self.since_sent = 0.0
+        # Из накопившейся пачки важен только последний pos.
+        latest = None
         for msg in self.ctx.poll():
             if msg.get("event") == "pos":
-                data = msg.get("data", {})
-                self.remote_pos[:] = data.get("pos", [0, 0])
-                self.other_id = data.get("sender_id")
+                latest = msg.get("data", {})
+        now = time.monotonic()
+        if latest is not None:
+            x, y = latest.get("pos", (0, 0))
+            vx, vy = latest.get("vel", (0.0, 0.0))
+            self.snapshots.append((now, x, y, vx, vy))
+            self.other_id = latest.get("sender_id")
+        if self.snapshots:
+            self.remote_pos.update(_sample_snapshots(self.snapshots, now - INTERP_DELAY))
         self.other.set_position(self.remote_pos)
 
         self.me_label.set_text(f"{self.ctx.role} (ID: {self.ctx.client_id})")
-        me_pos = self.me.get_world_position()
-        self.me_label.set_position((me_pos.x, me_pos.y - 40))
+        self.me_label.set_position((self.pos.x, self.pos.y - 40))
 
         other_label_str = (
             f"other (ID: {self.other_id})" if self.other_id is not None else "other (ID: ?)"
         )
         self.other_label.set_text(other_label_str)
-        other_pos = self.other.get_world_position()
-        self.other_label.set_position((other_pos.x, other_pos.y - 40))
+        self.other_label.set_position((self.remote_pos.x, self.remote_pos.y - 40))
 
 
 def main() -> None:
@@ -1,6 +1,8 @@
 """Демо: одна сцена, отдельные страницы (Меню, Магазин, Инвентарь, Настройки). Меню → Магазин, из Магазина назад в Меню, Выход."""
 
 import sys
+from collections import Counter
+from functools import partial
 from pathlib import Path
 
 current_dir = Path(__file__).parent
@@ -29,6 +31,8 @@ GRID_COLS = 4
 NAV_H = 52
 BTN_H = 42
 RADIUS = 12
+# Верх области контента под панелью навигации
+CONTENT_TOP = MARGIN + NAV_H + GAP
 
 # Палитра: тёмная тема, один акцент
 COLOR_BG = (22, 24, 32)
@@ -59,7 +63,7 @@ def _btn(text, scene, callback, w=140, h=BTN_H, accent=False):
 
 def _nav_bar(scene, title, on_back):
     """Панель сверху страницы: кнопка «Назад» и заголовок. Возвращает (bar, btn_back, lbl)."""
-    w = int(s.WH.x) - 2 * MARGIN
+    w = W - 2 * MARGIN
     bar = _panel(w, NAV_H, COLOR_NAV, scene, radius=10)
     bar.set_position((MARGIN, MARGIN), anchor=Anchor.TOP_LEFT)
     btn_back = _btn("← Меню", scene, on_back, w=100, h=36, accent=False)
@@ -120,6 +124,13 @@ def _inv_slot(scene, name):
     return slot
 
 
+def _kill_tree(sprite):
+    """Убивает спрайт вместе с потомками: Sprite.kill() детей лишь отвязывает."""
+    for child in list(sprite.children):
+        _kill_tree(child)
+    sprite.kill()
+
+
 # Имена страниц
 PAGE_MENU = "MENU"
 PAGE_SHOP = "SHOP"
@@ -127,13 +138,33 @@ PAGE_INVENTORY = "INVENTORY"
 PAGE_SETTINGS = "SETTINGS"
 
 
+class _LazyPage(s.Page):
+    """Страница, чьи спрайты строятся при первом открытии, а не при старте сцены."""
+
+    def __init__(self, name, scene, pm):
+        super().__init__(name, scene=scene)
+        self.pm = pm
+        self._built = False
+
+    def _build(self):
+        """Создаёт спрайты страницы; вызывается один раз из on_activate.
+
+        Наследники переопределяют; в базовом классе страница остаётся пустой.
+        """
+
+    def on_activate(self):
+        if not self._built:
+            self._built = True
+            self._build()
+
+
 class MenuPage(s.Page):
     """Главное меню: лейаут по центру экрана, флекс, выравнивание по центру."""
 
     def __init__(self, scene, pm):
         super().__init__(PAGE_MENU, scene=scene)
         self.pm = pm
-        w, h = int(s.WH.x), int(s.WH.y)
+        w, h = W, H
         content_top = MARGIN + 80
         content_h = h - content_top - 60
         content_w = w - 2 * MARGIN
@@ -177,14 +208,17 @@ class MenuPage(s.Page):
         raise SystemExit(0)
 
 
-class ShopPage(s.Page):
+class ShopPage(_LazyPage):
     """Страница магазина: назад в меню, категории, сетка товаров."""
 
     def __init__(self, scene, pm, status_cb):
-        super().__init__(PAGE_SHOP, scene=scene)
-        self.pm = pm
-        w, h = int(s.WH.x), int(s.WH.y)
-        content_top = MARGIN + NAV_H + GAP
+        super().__init__(PAGE_SHOP, scene, pm)
+        self._status_cb = status_cb
+
+    def _build(self):
+        scene, pm = self.scene, self.pm
+        w, h = W, H
+        content_top = CONTENT_TOP
         content_h = h - content_top - 50
         content_w = w - 2 * MARGIN
 
@@ -217,7 +251,7 @@ class ShopPage(s.Page):
 
         cat_names = ["Всё", "Оружие", "Броня", "Зелья", "Квесты"]
         cat_btns = [
-            _btn(n, scene, lambda n=n: status_cb(f"Категория: {n}"), w=SIDEBAR_W - 2 * PAD, h=36)
+            _btn(n, scene, partial(self._select_category, n), w=SIDEBAR_W - 2 * PAD, h=36)
             for n in cat_names
         ]
         for b in cat_btns:
@@ -248,12 +282,7 @@ class ShopPage(s.Page):
             ("Амулет", "200 G"),
             ("Кольцо", "180 G"),
         ]
-
-        def on_buy(name):
-            scene.inventory.append(name)
-            status_cb(f"В инвентарь: {name}")
-
-        cards = [_card(n, p, scene, on_buy=lambda n=n: on_buy(n)) for n, p in items]
+        cards = [_card(n, p, scene, on_buy=partial(self._buy, n)) for n, p in items]
         layout_grid(
             grid_panel,
             cards,
@@ -267,16 +296,25 @@ class ShopPage(s.Page):
         ).apply()
         self.add_sprite(main)
 
+    def _select_category(self, name):
+        self._status_cb(f"Категория: {name}")
+
+    def _buy(self, name):
+        self.scene.inventory.append(name)
+        self._status_cb(f"В инвентарь: {name}")
+
 
-class InventoryPage(s.Page):
+class InventoryPage(_LazyPage):
     """Страница инвентаря: флекс с купленными предметами, обновляется при открытии."""
 
     def __init__(self, scene, pm, status_cb):
-        super().__init__(PAGE_INVENTORY, scene=scene)
-        self.pm = pm
+        super().__init__(PAGE_INVENTORY, scene, pm)
         self._status_cb = status_cb
-        w, h = int(s.WH.x), int(s.WH.y)
-        content_top = MARGIN + NAV_H + GAP
+
+    def _build(self):
+        scene, pm = self.scene, self.pm
+        w, h = W, H
+        content_top = CONTENT_TOP
         content_h = h - content_top - 50
         content_w = w - 2 * MARGIN
 
@@ -290,11 +328,22 @@ class InventoryPage(s.Page):
         inv_inner_h = content_h - 2 * PAD - BTN_H - GAP
         self._inv_slots = s.Sprite("", (inv_inner_w, inv_inner_h), (0, 0), scene=scene)
         self._inv_slots.set_rect_shape(size=(inv_inner_w, inv_inner_h), color=(0, 0, 0, 0), width=0)
+        # Слоты живут между обновлениями: при обновлении создаём/удаляем только разницу
+        self._slots_by_name: dict[str, list] = {}
+        self._empty_hint = s.TextSprite(
+            "Пусто. Купленные товары появятся здесь.",
+            16,
+            COLOR_TEXT_DIM,
+            (0, 0),
+            anchor=Anchor.CENTER,
+            scene=scene,
+        )
+        self._empty_hint.set_parent(self._inv_slots, keep_world_position=False)
 
         btn = _btn(
             "Обновить",
             scene,
-            lambda: (self._refresh_slots(), status_cb("Инвентарь обновлён")),
+            lambda: (self._refresh_slots(), self._status_cb("Инвентарь обновлён")),
             w=120,
             h=38,
         )
@@ -310,29 +359,30 @@ class InventoryPage(s.Page):
         self.add_sprite(main)
 
     def _refresh_slots(self):
-        for child in list(self._inv_slots.children):
-            child.set_parent(None)
-            if hasattr(child, "kill"):
-                child.kill()
         inv = getattr(self.scene, "inventory", [])
-        if not inv:
-            hint = s.TextSprite(
-                "Пусто. Купленные товары появятся здесь.",
-                16,
-                COLOR_TEXT_DIM,
-                (0, 0),
-                anchor=Anchor.CENTER,
-                scene=self.scene,
-            )
-            hint.set_parent(self._inv_slots, keep_world_position=False)
-            hint.local_position = (0, 0)
-        else:
-            for name in inv:
+        wanted = Counter(inv)
+        for name, slots in list(self._slots_by_name.items()):
+            while len(slots) > wanted[name]:
+                slot = slots.pop()
+                slot.set_parent(None)
+                _kill_tree(slot)
+            if not slots:
+                del self._slots_by_name[name]
+        for name, count in wanted.items():
+            slots = self._slots_by_name.setdefault(name, [])
+            while len(slots) < count:
                 slot = _inv_slot(self.scene, name)
                 slot.set_parent(self._inv_slots, keep_world_position=False)
+                slots.append(slot)
+
+        self._empty_hint.set_active(not inv)
+        if inv:
+            items = [c for c in self._inv_slots.children if c is not self._empty_hint]
+        else:
+            items = [self._empty_hint]
         layout_flex_row(
             self._inv_slots,
-            list(self._inv_slots.children),
+            items,
             gap=GAP,
             padding=PAD,
             align_main=LayoutAlignMain.START,
@@ -341,25 +391,30 @@ class InventoryPage(s.Page):
         ).apply()
 
     def on_activate(self):
-        self._refresh_slots()
+        super().on_activate()
         self._inv_slots.set_active(True)
         for child in list(self._inv_slots.children):
             child.set_active(True)
+        self._refresh_slots()
 
     def on_deactivate(self):
+        if not self._built:
+            return
         self._inv_slots.set_active(False)
         for child in list(self._inv_slots.children):
             child.set_active(False)
 
 
-class SettingsPage(s.Page):
+class SettingsPage(_LazyPage):
     """Страница настроек: назад в меню."""
 
     def __init__(self, scene, pm):
-        super().__init__(PAGE_SETTINGS, scene=scene)
-        self.pm = pm
-        w, h = int(s.WH.x), int(s.WH.y)
-        content_top = MARGIN + NAV_H + GAP
+        super().__init__(PAGE_SETTINGS, scene, pm)
+
+    def _build(self):
+        scene, pm = self.scene, self.pm
+        w, h = W, H
+        content_top = CONTENT_TOP
         content_h = h - content_top - 50
         content_w = min(400, w - 2 * MARGIN)
         cx = w // 2
@@ -389,7 +444,7 @@ class MenuShopScene(s.Scene):
 
     def __init__(self):
         super().__init__()
-        w, h = int(s.WH.x), int(s.WH.y)
+        w, h = W, H
 
         bg = s.Sprite("", (w, h), (w // 2, h // 2), scene=self, sorting_order=-10)
         bg.set_rect_shape(size=(w, h), color=COLOR_BG, width=0)
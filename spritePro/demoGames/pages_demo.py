@@ -37,7 +37,7 @@ class BasePage(s.Page):
             1,
             1,
             s.EasingType.EASE_OUT,
-            on_update=lambda x: self.text.set_scale(x),
+            on_update=self.text.set_scale,
         )
         self.anim.add_tween(
             "bg",
@@ -45,7 +45,7 @@ class BasePage(s.Page):
             1,
             1,
             s.EasingType.EASE_OUT,
-            on_update=lambda x: self.bg.set_scale(x),
+            on_update=self.bg.set_scale,
         )
         self.anim.add_tween(
             "btn",
@@ -53,7 +53,7 @@ class BasePage(s.Page):
             1,
             1,
             s.EasingType.EASE_OUT,
-            on_update=lambda x: self.btn.set_scale(x),
+            on_update=self.btn.set_scale,
         )
 
     def on_activate(self):
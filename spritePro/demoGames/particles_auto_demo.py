@@ -46,8 +46,8 @@ class ParticlesAutoEmitScene(s.Scene):
     def update(self, dt: float) -> None:
         axis_x = s.input.get_axis(pygame.K_LEFT, pygame.K_RIGHT)
         axis_y = s.input.get_axis(pygame.K_UP, pygame.K_DOWN)
-        self.mover.velocity.x = axis_x * self.mover.speed * s.dt
-        self.mover.velocity.y = axis_y * self.mover.speed * s.dt
+        step = self.mover.speed * s.dt
+        self.mover.velocity.update(axis_x * step, axis_y * step)
 
         self.step_emitter.set_position(self.mover.rect.center)
 
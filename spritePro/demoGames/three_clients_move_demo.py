@@ -25,6 +25,10 @@ Kivy/mobile:
 """
 
 import sys
+import time
+from bisect import bisect_right
+from collections import deque
+from operator import itemgetter
 from pathlib import Path
 
 current_dir = Path(__file__).parent
@@ -35,6 +39,21 @@ import pygame  # noqa: E402
 
 import spritePro as s  # noqa: E402
 
+# Dead reckoning: вместе с позицией шлём скорость, и получатели сами продолжают
+# движение между пакетами. Новый пакет нужен, только когда скорость сменилась или
+# предсказание разошлось с реальной позицией больше чем на порог; стоя на месте —
+# редкий повтор, чтобы подключившийся позже клиент всё равно узнал, где мы.
+SEND_THRESHOLD = 1.0
+IDLE_RESEND_INTERVAL = 1.0
+# В движении повторяем пакет чаще, чем истекает MAX_EXTRAPOLATION, иначе при
+# ровном ходе получатель успевал бы остановить игрока до следующего пакета.
+MOVING_RESEND_INTERVAL = 0.25
+# Дольше этого без пакетов не экстраполируем (игрок отвалился или лагает).
+MAX_EXTRAPOLATION = 0.5
+# Чужих игроков рисуем с задержкой, интерполируя между полученными снимками:
+# так пакеты, пришедшие неровно, не дают рывков.
+INTERP_DELAY = 0.1
+SNAPSHOT_BUFFER = 8
 
 PALETTE = [
     (220, 70, 70),  # id 0
@@ -44,6 +63,27 @@ PALETTE = [
 ]
 
 
+def _sample_snapshots(snapshots: deque, render_t: float) -> tuple[float, float]:
+    """Позиция на момент render_t по снимкам (t, x, y, vx, vy).
+
+    Между двумя соседними снимками — линейная интерполяция, после последнего —
+    экстраполяция по его скорости, но не дальше MAX_EXTRAPOLATION.
+
+    Такая же функция есть в local_multiplayer_demo.py: демо запускаются как отдельные
+    скрипты, поэтому копии держим одинаковыми и правим вместе.
+    """
+    i = bisect_right(snapshots, render_t, key=itemgetter(0))
+    if i == 0:
+        return snapshots[0][1], snapshots[0][2]
+    t0, x0, y0, vx, vy = snapshots[i - 1]
+    if i == len(snapshots):
+        ahead = min(render_t - t0, MAX_EXTRAPOLATION)
+        return x0 + vx * ahead, y0 + vy * ahead
+    t1, x1, y1, _, _ = snapshots[i]
+    alpha = (render_t - t0) / (t1 - t0)
+    return x0 + (x1 - x0) * alpha, y0 + (y1 - y0) * alpha
+
+
 def _color_for_id(client_id: int) -> tuple[int, int, int]:
     return PALETTE[client_id % len(PALETTE)]
 
@@ -69,6 +109,7 @@ class ThreeClientsMoveScene(s.Scene):
         self.me_id = s.TextSprite("ID: ?", 18, (255, 255, 255), (200, 250), scene=self)
         self.others: dict[int, s.Sprite] = {}
         self.others_id: dict[int, s.TextSprite] = {}
+        self.others_snapshots: dict[int, deque] = {}
         self.last_id: int | None = None
         self.base_positions = {
             0: (200, 300),
@@ -77,41 +118,77 @@ class ThreeClientsMoveScene(s.Scene):
             3: (450, 450),
         }
         self.speed = 260.0
-        self.tick_rate = 60
+        self.tick_rate = 20
+        self.send_interval = 1.0 / self.tick_rate
+        self.pos = self.me.get_world_position()
+        self.last_sent_pos = pygame.Vector2(self.pos)
+        self.last_sent_vel = pygame.Vector2()
+        # Сколько прошло с последней отправки; стартуем «просроченными», чтобы
+        # первая позиция ушла сразу.
+        self.since_sent = IDLE_RESEND_INTERVAL
 
     def update(self, dt: float) -> None:
         if self.ctx.client_id != self.last_id:
             self.last_id = self.ctx.client_id
             my_color = _color_for_id(self.ctx.client_id)
             self.me.set_color(my_color)
-            self.me_id.color = my_color
-            self.window_id.color = my_color
+            self.me_id.set_color(my_color)
+            self.window_id.set_color(my_color)
             me_pos = self.base_positions.get(self.ctx.client_id)
             if me_pos is not None:
                 self.me.set_position(me_pos)
+                self.pos.update(me_pos)
 
         self.wait_id.set_active(not self.ctx.id_assigned)
         if self.ctx.id_assigned:
             dx = s.input.get_axis(pygame.K_a, pygame.K_d)
             dy = s.input.get_axis(pygame.K_w, pygame.K_s)
-            pos = self.me.get_world_position()
+            # Дробную позицию храним сами: rect её округляет, и без этого
+            # фактическая скорость расходилась бы с отправленной.
+            pos = self.pos
             pos.x += dx * self.speed * dt
             pos.y += dy * self.speed * dt
             self.me.set_position(pos)
 
-            self.ctx.send_every(
-                "pos",
-                {"pos": list(pos), "sender_id": self.ctx.client_id},
-                1.0 / self.tick_rate,
+            vel = pygame.Vector2(dx, dy) * self.speed
+            self.since_sent += dt
+            predicted = self.last_sent_pos + self.last_sent_vel * self.since_sent
+            diverged = (
+                vel != self.last_sent_vel
+                or pos.distance_squared_to(predicted) > SEND_THRESHOLD * SEND_THRESHOLD
             )
+            if diverged:
+                interval = self.send_interval
+            elif vel:
+                interval = MOVING_RESEND_INTERVAL
+            else:
+                interval = IDLE_RESEND_INTERVAL
+            # Пакет собираем только когда действительно отправляем
+            if self.since_sent >= interval:
+                self.ctx.send(
+                    "pos",
+                    {
+                        "pos": [round(pos.x, 1), round(pos.y, 1)],
+                        "vel": [vel.x, vel.y],
+                        "sender_id": self.ctx.client_id,
+                    },
+                )
+                self.last_sent_pos.update(pos)
+                self.last_sent_vel.update(vel)
+                self.since_sent = 0.0
 
+        # Из накопившейся пачки важен только последний pos каждого игрока.
+        latest: dict[int, dict] = {}
         for msg in self.ctx.poll():
             if msg.get("event") != "pos":
                 continue
             data = msg.get("data", {})
             sender_id = data.get("sender_id")
-            if sender_id is None:
-                continue
+            if sender_id is not None:
+                latest[sender_id] = data
+
+        now = time.monotonic()
+        for sender_id, data in latest.items():
             if sender_id not in self.others:
                 other = s.Sprite("", (50, 50), (450, 300), scene=self)
                 other.set_color(_color_for_id(sender_id))
@@ -124,18 +201,21 @@ class ThreeClientsMoveScene(s.Scene):
                     scene=self,
                 )
                 self.others_id[sender_id] = label
-            self.others[sender_id].set_position(data.get("pos", [0, 0]))
+                self.others_snapshots[sender_id] = deque(maxlen=SNAPSHOT_BUFFER)
+            x, y = data.get("pos", (0, 0))
+            vx, vy = data.get("vel", (0.0, 0.0))
+            self.others_snapshots[sender_id].append((now, x, y, vx, vy))
+
+        render_t = now - INTERP_DELAY
+        for sender_id, sprite in self.others.items():
+            x, y = _sample_snapshots(self.others_snapshots[sender_id], render_t)
+            sprite.set_position((x, y))
+            self.others_id[sender_id].set_position((x, y - 40))
 
-        current_pos = self.me.get_world_position()
         self.me_id.set_text(f"ID: {self.ctx.client_id}")
-        self.me_id.set_position((current_pos.x, current_pos.y - 40))
+        self.me_id.set_position((self.pos.x, self.pos.y - 40))
         self.window_id.set_text(f"Window ID: {self.ctx.client_id}")
 
-        for sender_id, sprite in self.others.items():
-            label = self.others_id[sender_id]
-            spr_pos = sprite.get_world_position()
-            label.set_position((spr_pos.x, spr_pos.y - 40))
-
 
 def main(default_platform: str = "kivy") -> None:
     s.run(
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from typing import Callable, Dict, List, Any, Optional
 
+_ALLOWED_ROUTES = frozenset(("local", "server", "clients", "all", "net"))
+_NET_ROUTES = frozenset(("server", "clients", "all", "net"))
+
 
 class _SignalBase:
     """Базовый сигнал с локальным списком обработчиков."""
@@ -213,8 +216,7 @@ class EventBus:
             из сети»). Так обрабатывают и свои (route="all"), и чужие сообщения
             одним кодом.
         """
-        allowed_routes = {"local", "server", "clients", "all", "net"}
-        if route not in allowed_routes:
+        if route not in _ALLOWED_ROUTES:
             payload["route"] = route
             route = "local"
 
@@ -226,7 +228,7 @@ class EventBus:
             if signal is not None:
                 signal.send(route="local", **payload)
 
-        if route in ("server", "clients", "all", "net"):
+        if route in _NET_ROUTES:
             sender = net or self._net_sender
             if sender is not None:
                 sender.send(event_name, payload)
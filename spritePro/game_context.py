@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import List, Tuple
+import math
 import os
 import time
 
@@ -15,12 +18,18 @@ from .scenes import SceneManager
 from .plugins import get_plugin_manager
 
 
-DEFAULT_CAMERA_KEYS = {
-    "left": (pygame.K_LEFT,),
-    "right": (pygame.K_RIGHT,),
-    "up": (pygame.K_UP,),
-    "down": (pygame.K_DOWN,),
-}
+# Только для чтения: _normalize_camera_keys отдаёт этот объект без копии
+DEFAULT_CAMERA_KEYS = MappingProxyType(
+    {
+        "left": (pygame.K_LEFT,),
+        "right": (pygame.K_RIGHT,),
+        "up": (pygame.K_UP,),
+        "down": (pygame.K_DOWN,),
+    }
+)
+
+# Множитель диагонального шага: при двух осях длина шага остаётся равной speed * dt
+_DIAGONAL_STEP = 1.0 / math.sqrt(2.0)
 
 WINDOW_RESIZE_EVENT_TYPES = tuple(
     event_type
@@ -62,13 +71,13 @@ class CameraController:
         self._game.clear_camera_follow()
 
     @staticmethod
-    def _normalize_camera_keys(custom: dict | None) -> dict[str, Tuple[int, ...]]:
+    def _normalize_camera_keys(custom: dict | None) -> Mapping[str, Tuple[int, ...]]:
         """Нормализует словарь клавиш управления камерой."""
+        if not custom:
+            return DEFAULT_CAMERA_KEYS
         mapping: dict[str, Tuple[int, ...]] = {
             direction: tuple(keys) for direction, keys in DEFAULT_CAMERA_KEYS.items()
         }
-        if not custom:
-            return mapping
         for direction, value in custom.items():
             if direction not in mapping:
                 continue
@@ -97,24 +106,20 @@ class CameraController:
     ) -> Vector2:
         """Обрабатывает ввод и перемещает камеру."""
         mapping = self._normalize_camera_keys(keys)
-        move = Vector2()
-
-        def handle(direction: str, offset: Vector2) -> None:
-            """Обрабатывает движение камеры по одной оси."""
-            for key in mapping.get(direction, ()):
-                if input_state.is_pressed(key):
-                    move.x += offset.x
-                    move.y += offset.y
-                    break
-
-        handle("left", Vector2(-1, 0))
-        handle("right", Vector2(1, 0))
-        handle("up", Vector2(0, -1))
-        handle("down", Vector2(0, 1))
-
-        if move.length_squared() > 0:
-            move = move.normalize() * speed * dt
-            self.move(move.x, move.y)
+        is_pressed = input_state.is_pressed
+        # Направление по осям: -1/0/1, противоположные клавиши гасят друг друга
+        dx = any(is_pressed(key) for key in mapping["right"]) - any(
+            is_pressed(key) for key in mapping["left"]
+        )
+        dy = any(is_pressed(key) for key in mapping["down"]) - any(
+            is_pressed(key) for key in mapping["up"]
+        )
+
+        if dx or dy:
+            step = speed * dt
+            if dx and dy:
+                step *= _DIAGONAL_STEP
+            self.move(dx * step, dy * step)
 
         if mouse_drag and input_state.is_mouse_pressed(mouse_button):
             rel = input_state.mouse_rel
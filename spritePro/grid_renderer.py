@@ -70,9 +70,14 @@ def draw_world_grid(
     if cache_key == _grid_cache_key and _grid_cache_surf is not None:
         grid_surf = _grid_cache_surf
     else:
-        grid_surf = pygame.Surface((width, height), pygame.SRCALPHA)
-        if grid_alpha < 255:
-            grid_surf.set_alpha(grid_alpha)
+        # При панорамировании ключ меняется каждый кадр, а размер — нет:
+        # очищаем прежний буфер вместо выделения новой поверхности
+        if _grid_cache_surf is not None and _grid_cache_surf.get_size() == (width, height):
+            grid_surf = _grid_cache_surf
+            grid_surf.fill((0, 0, 0, 0))
+        else:
+            grid_surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        grid_surf.set_alpha(grid_alpha if grid_alpha < 255 else None)
 
         def _line_level(w: float) -> Tuple[Tuple[int, int, int], int]:
             if abs(w % 500) < 0.1 or abs(w % 500) > 499.9:
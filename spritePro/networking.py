@@ -102,9 +102,15 @@ def _enable_nodelay(sock: socket.socket) -> None:
         pass
 
 
+# Компактный JSON: без пробелов-разделителей и без \uXXXX для не-ASCII (кириллица
+# уходит как UTF-8). Энкодер один на модуль: json.dumps с нестандартными
+# параметрами создаёт новый JSONEncoder на каждый вызов.
+_json_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
 def _encode_message(event: str, data: Optional[Dict[str, Any]] = None) -> bytes:
     payload = {"event": event, "data": data or {}}
-    return (json.dumps(payload) + "\n").encode("utf-8")
+    return (_json_encode(payload) + "\n").encode("utf-8")
 
 
 def _decode_message(raw: str) -> Optional[NetMessage]:
@@ -67,6 +67,8 @@ class ParticleConfig:
         screen_space (bool): Если True, частицы игнорируют смещение камеры. По умолчанию False.
         custom_factory (Optional[Callable]): Хук для изменения частицы после создания. По умолчанию None.
         image (Union[Optional[pygame.Surface], Path]): Готовая поверхность для дублирования для каждой частицы. По умолчанию None.
+            Частицы из пула сравнивают её по идентичности и копируют заново только новую поверхность: после
+            правки той же поверхности на месте (fill/blit) присвойте image новый объект, например её copy().
         image_factory (Optional[Callable[[int], pygame.Surface]]): Фабрика для создания изображения для каждой частицы по индексу. По умолчанию None.
         particle_class (Optional[Type[Particle]]): Пользовательский подкласс Particle для создания. По умолчанию None.
         particle_template (Optional[Particle]): Готовый экземпляр Particle как шаблон для создания новых частиц. Копируются свойства шаблона, но позиция, скорость и время жизни берутся из конфига. По умолчанию None.
@@ -186,7 +188,11 @@ class Particle(spritePro.Sprite):
         sorting_order: Optional[int] = None,
     ) -> None:
         """Сбрасывает параметры частицы для повторного использования."""
-        self.set_image(image)
+        # Частица из пула обычно получает ту же поверхность из конфига, что и в
+        # прошлый раз: её копия уже лежит в original_image, и повторный set_image
+        # лишь заново копировал бы исходник (для крупных текстур — основная цена emit)
+        if image is not self._image_source:
+            self.set_image(image)
         if sorting_order is not None:
             self.set_sorting_order(sorting_order)
         self._fpos = Vector2(pos[0], pos[1])
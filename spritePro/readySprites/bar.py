@@ -610,8 +610,13 @@ class BarWithBackground(Bar):
         if not hasattr(self, "_fill_surface"):
             return
 
-        # Create new surface for clipped fill
-        clipped_surface = pygame.Surface(self._fill_size, pygame.SRCALPHA)
+        # Во время анимации обрезка пересчитывается каждый кадр: переиспользуем
+        # буфер прежнего размера, новый создаём только при смене fill_size
+        clipped_surface = getattr(self, "_clipped_fill_surface", None)
+        if clipped_surface is None or clipped_surface.get_size() != tuple(self._fill_size):
+            clipped_surface = pygame.Surface(self._fill_size, pygame.SRCALPHA)
+        else:
+            clipped_surface.fill((0, 0, 0, 0))
 
         # Calculate clip rectangle based on fill amount and direction
         clip_rect = self._calculate_clip_rect()
@@ -692,7 +697,8 @@ class BarWithBackground(Bar):
         fill_surface = pygame.Surface(self._fill_size, pygame.SRCALPHA)
         fill_surface.fill((r, g, b, self._fill_alpha))
 
-        self._fill_surface = pygame.transform.scale(fill_surface, self._fill_size)
+        # Поверхность уже нужного размера — масштабировать нечего
+        self._fill_surface = fill_surface
         self._update_clipped_image()
         return self
 
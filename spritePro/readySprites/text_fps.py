@@ -4,6 +4,7 @@
 текущий FPS (Frames Per Second) с использованием TextSprite из SpritePro.
 """
 
+from collections import deque
 from pathlib import Path
 from typing import Tuple, Optional, Union
 
@@ -82,8 +83,9 @@ class Text_fps(TextSprite):
         self.average_frames = average_frames
         self.update_interval = update_interval
 
-        # FPS calculation state
-        self.fps_history = []
+        # FPS calculation state: кольцевой буфер и его сумма — среднее за O(1)
+        self.fps_history = deque(maxlen=max(1, average_frames))
+        self._fps_sum = 0.0
         self.last_update_time = 0
         self.current_fps = 0.0
         self.frame_count = 0
@@ -105,15 +107,18 @@ class Text_fps(TextSprite):
         # Calculate FPS using SpritePro's delta time
         if hasattr(s, "dt") and s.dt > 0:
             current_fps = 1.0 / s.dt
-            self.fps_history.append(current_fps)
+            if self.fps_history.maxlen != max(1, self.average_frames):
+                self._resize_history()
 
-            # Maintain rolling average
-            if len(self.fps_history) > self.average_frames:
-                self.fps_history.pop(0)
+            # Maintain rolling average: вытесняемое значение вычитаем из суммы
+            if len(self.fps_history) == self.fps_history.maxlen:
+                self._fps_sum -= self.fps_history[0]
+            self.fps_history.append(current_fps)
+            self._fps_sum += current_fps
 
             # Calculate average FPS
             if self.fps_history:
-                avg_fps = sum(self.fps_history) / len(self.fps_history)
+                avg_fps = self._fps_sum / len(self.fps_history)
 
                 # Update min/max tracking
                 self.min_fps = min(self.min_fps, avg_fps)
@@ -126,6 +131,11 @@ class Text_fps(TextSprite):
                     self._update_display_text()
                     self.last_update_time = current_time
 
+    def _resize_history(self):
+        """Пересоздаёт буфер истории под текущее average_frames, сохраняя последние значения."""
+        self.fps_history = deque(self.fps_history, maxlen=max(1, self.average_frames))
+        self._fps_sum = sum(self.fps_history)
+
     def _update_display_text(self):
         """Обновляет отображаемый текст текущим значением FPS."""
         fps_text = f"{self.current_fps:.{self.precision}f}"
@@ -157,6 +167,7 @@ class Text_fps(TextSprite):
     def reset_stats(self):
         """Сбрасывает статистику FPS и историю."""
         self.fps_history.clear()
+        self._fps_sum = 0.0
         self.min_fps = float("inf")
         self.max_fps = 0.0
         self.total_frames = 0
@@ -193,8 +204,7 @@ class Text_fps(TextSprite):
             self.update_interval = update_interval
 
         # Trim history if new frame count is smaller
-        if len(self.fps_history) > self.average_frames:
-            self.fps_history = self.fps_history[-self.average_frames :]
+        self._resize_history()
 
 
 # Convenience function for quick FPS counter creation
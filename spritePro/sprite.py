@@ -57,6 +57,33 @@ def _vector2_to_int_tuple(vec: Vector2) -> Tuple[int, int]:
     return int(vec.x), int(vec.y)
 
 
+def _copy_in_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """Возвращает копию поверхности в формате экрана, чтобы blit не конвертировал пиксели.
+
+    Поверхности с попиксельной альфой остаются с альфой, непрозрачные — непрозрачными.
+    Без display surface (embedded/Kivy) возвращает обычную копию.
+    """
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        try:
+            # Флаг SRCALPHA выставляется и общей альфой (set_alpha), поэтому
+            # попиксельную альфу определяем по маске альфа-канала
+            if surface.get_masks()[3]:
+                converted = surface.convert_alpha()
+            else:
+                converted = surface.convert()
+        except pygame.error:
+            return surface.copy()
+        # convert()/convert_alpha() теряют colorkey и общую альфу — переносим их
+        colorkey = surface.get_colorkey()
+        if colorkey is not None:
+            converted.set_colorkey(colorkey)
+        alpha = surface.get_alpha()
+        if alpha is not None:
+            converted.set_alpha(alpha)
+        return converted
+    return surface.copy()
+
+
 class Sprite(pygame.sprite.Sprite):
     """Базовый класс спрайта с поддержкой движения, анимации и визуальных эффектов.
 
@@ -980,7 +1007,7 @@ class Sprite(pygame.sprite.Sprite):
         self._image_source = image_source
 
         if isinstance(image_source, pygame.Surface):
-            img = image_source.copy()
+            img = _copy_in_display_format(image_source)
         else:
             img = None
             if image_source:
@@ -1005,7 +1032,9 @@ class Sprite(pygame.sprite.Sprite):
             self.size = _vector2_to_int_tuple(self.size_vector)
 
         self.original_image = img
-        self._transformed_image = self.original_image.copy()
+        # _transform_dirty ниже заставит _update_image пересобрать трансформированную
+        # поверхность до первого чтения, так что отдельная копия здесь не нужна
+        self._transformed_image = self.original_image
         self.image = self.original_image.copy()
 
         existing_rect = getattr(self, "rect", None)
@@ -6,9 +6,20 @@
 
 import math
 import time
-from typing import Tuple
+from typing import Optional, Tuple
 import colorsys
 
+# Период синусоидальных эффектов и обратная величина: считаются один раз при импорте,
+# а не в каждом вызове эффекта (эффекты вызываются для каждого спрайта каждый кадр).
+_TAU = math.tau
+_INV_TAU = 1.0 / _TAU
+
+# Таблица оттенков для rainbow: полный круг HSV при S=V=1, 256 шагов.
+# Остальные насыщенность и яркость получаются из неё линейно: v * (1 - s * (1 - c)).
+_HUE_STEPS = 256
+_HUE_LUT = tuple(colorsys.hsv_to_rgb(i / _HUE_STEPS, 1.0, 1.0) for i in range(_HUE_STEPS))
+_HUE_LUT_RGB = tuple((int(r * 255), int(g * 255), int(b * 255)) for r, g, b in _HUE_LUT)
+
 
 class ColorEffects:
     """Статический класс, содержащий различные методы цветовых эффектов.
@@ -24,6 +35,7 @@ class ColorEffects:
         target_color: Tuple[int, int, int] = (255, 255, 255),
         intensity: float = 1.0,
         offset: float = 0.0,
+        now: Optional[float] = None,
     ) -> Tuple[int, int, int]:
         """Создает эффект пульсации цвета между двумя цветами.
 
@@ -33,11 +45,13 @@ class ColorEffects:
             target_color (Tuple[int, int, int], optional): Целевой цвет RGB. По умолчанию (255, 255, 255).
             intensity (float, optional): Интенсивность пульсации 0.0-1.0. По умолчанию 1.0.
             offset (float, optional): Смещение времени для множественных синхронизированных пульсаций. По умолчанию 0.0.
+            now (Optional[float], optional): Момент времени в секундах (как у time.time()); None — текущее.
+                Позволяет вычислить несколько эффектов по одной метке времени. По умолчанию None.
 
         Returns:
             Tuple[int, int, int]: Кортеж RGB цвета.
         """
-        t = time.time() * speed + offset
+        t = (time.time() if now is None else now) * speed + offset
         pulse_value = (math.sin(t) + 1) / 2  # Normalize to 0-1
         pulse_value *= intensity
 
@@ -54,6 +68,7 @@ class ColorEffects:
         saturation: float = 1.0,
         brightness: float = 1.0,
         offset: float = 0.0,
+        now: Optional[float] = None,
     ) -> Tuple[int, int, int]:
         """Создает эффект радуги, циклически проходящий через цветовой спектр.
 
@@ -62,16 +77,29 @@ class ColorEffects:
             saturation (float, optional): Насыщенность цвета 0.0-1.0. По умолчанию 1.0.
             brightness (float, optional): Яркость цвета 0.0-1.0. По умолчанию 1.0.
             offset (float, optional): Смещение времени для множественных синхронизированных радуг. По умолчанию 0.0.
+            now (Optional[float], optional): Момент времени в секундах (как у time.time()); None — текущее.
+                Позволяет вычислить несколько эффектов по одной метке времени. По умолчанию None.
 
         Returns:
             Tuple[int, int, int]: Кортеж RGB цвета.
+
+        Note:
+            Оттенок берётся из таблицы на 256 шагов вместо colorsys.hsv_to_rgb на каждый вызов.
         """
-        t = time.time() * speed + offset
-        hue = (t % (2 * math.pi)) / (2 * math.pi)  # Normalize to 0-1
+        t = (time.time() if now is None else now) * speed + offset
+        index = int((t % _TAU) * _INV_TAU * _HUE_STEPS) % _HUE_STEPS
+
+        if saturation == 1.0 and brightness == 1.0:
+            return _HUE_LUT_RGB[index]
 
-        # Convert HSV to RGB
-        rgb = colorsys.hsv_to_rgb(hue, saturation, brightness)
-        return (int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
+        r, g, b = _HUE_LUT[index]
+        white = 1.0 - saturation
+        scale = brightness * 255
+        return (
+            int((white + saturation * r) * scale),
+            int((white + saturation * g) * scale),
+            int((white + saturation * b) * scale),
+        )
 
     @staticmethod
     def breathing(
@@ -79,6 +107,7 @@ class ColorEffects:
         base_color: Tuple[int, int, int] = (100, 100, 100),
         intensity: float = 0.7,
         offset: float = 0.0,
+        now: Optional[float] = None,
     ) -> Tuple[int, int, int]:
         """Создает эффект дыхания путем изменения яркости.
 
@@ -87,11 +116,13 @@ class ColorEffects:
             base_color (Tuple[int, int, int], optional): Базовый цвет RGB. По умолчанию (100, 100, 100).
             intensity (float, optional): Интенсивность дыхания 0.0-1.0. По умолчанию 0.7.
             offset (float, optional): Смещение времени. По умолчанию 0.0.
+            now (Optional[float], optional): Момент времени в секундах (как у time.time()); None — текущее.
+                Позволяет вычислить несколько эффектов по одной метке времени. По умолчанию None.
 
         Returns:
             Tuple[int, int, int]: Кортеж RGB цвета.
         """
-        t = time.time() * speed + offset
+        t = (time.time() if now is None else now) * speed + offset
         breath_value = (math.sin(t) + 1) / 2  # Normalize to 0-1
         brightness = 1.0 - (intensity * (1.0 - breath_value))
 
@@ -102,13 +133,20 @@ class ColorEffects:
         return (max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b)))
 
     @staticmethod
-    def wave(speed: float = 1.0, colors: list = None, offset: float = 0.0) -> Tuple[int, int, int]:
+    def wave(
+        speed: float = 1.0,
+        colors: list = None,
+        offset: float = 0.0,
+        now: Optional[float] = None,
+    ) -> Tuple[int, int, int]:
         """Создает волновой эффект, циклически проходящий через несколько цветов.
 
         Args:
             speed (float, optional): Множитель скорости волны. По умолчанию 1.0.
             colors (list, optional): Список кортежей RGB цветов для циклического перехода. По умолчанию None.
             offset (float, optional): Смещение времени. По умолчанию 0.0.
+            now (Optional[float], optional): Момент времени в секундах (как у time.time()); None — текущее.
+                Позволяет вычислить несколько эффектов по одной метке времени. По умолчанию None.
 
         Returns:
             Tuple[int, int, int]: Кортеж RGB цвета.
@@ -126,9 +164,9 @@ class ColorEffects:
         if len(colors) < 2:
             return colors[0] if colors else (255, 255, 255)
 
-        t = time.time() * speed + offset
+        t = (time.time() if now is None else now) * speed + offset
         cycle_length = len(colors)
-        position = (t % (2 * math.pi)) / (2 * math.pi) * cycle_length
+        position = (t % _TAU) * _INV_TAU * cycle_length
 
         # Get current and next color indices
         current_idx = int(position) % cycle_length
@@ -154,6 +192,7 @@ class ColorEffects:
         flicker_color: Tuple[int, int, int] = (255, 255, 0),
         intensity: float = 0.3,
         randomness: float = 0.5,
+        now: Optional[float] = None,
     ) -> Tuple[int, int, int]:
         """Создает эффект мерцания, как у свечи или сломанного света.
 
@@ -163,11 +202,13 @@ class ColorEffects:
             flicker_color (Tuple[int, int, int], optional): Акцентный цвет мерцания RGB. По умолчанию (255, 255, 0).
             intensity (float, optional): Интенсивность мерцания 0.0-1.0. По умолчанию 0.3.
             randomness (float, optional): Фактор случайности 0.0-1.0. По умолчанию 0.5.
+            now (Optional[float], optional): Момент времени в секундах (как у time.time()); None — текущее.
+                Позволяет вычислить несколько эффектов по одной метке времени. По умолчанию None.
 
         Returns:
             Tuple[int, int, int]: Кортеж RGB цвета.
         """
-        t = time.time() * speed
+        t = (time.time() if now is None else now) * speed
 
         # Create pseudo-random flicker using multiple sine waves
         flicker1 = math.sin(t * 1.7) * 0.5 + 0.5
@@ -190,6 +231,7 @@ class ColorEffects:
         off_color: Tuple[int, int, int] = (0, 0, 0),
         duty_cycle: float = 0.5,
         offset: float = 0.0,
+        now: Optional[float] = None,
     ) -> Tuple[int, int, int]:
         """Создает стробоскопический эффект, чередующийся между двумя цветами.
 
@@ -199,12 +241,14 @@ class ColorEffects:
             off_color (Tuple[int, int, int], optional): Цвет когда "выключен" RGB. По умолчанию (0, 0, 0).
             duty_cycle (float, optional): Доля времени в состоянии "включен" (0.0-1.0). По умолчанию 0.5.
             offset (float, optional): Смещение времени. По умолчанию 0.0.
+            now (Optional[float], optional): Момент времени в секундах (как у time.time()); None — текущее.
+                Позволяет вычислить несколько эффектов по одной метке времени. По умолчанию None.
 
         Returns:
             Tuple[int, int, int]: Кортеж RGB цвета.
         """
-        t = time.time() * speed + offset
-        cycle_position = (t % (2 * math.pi)) / (2 * math.pi)
+        t = (time.time() if now is None else now) * speed + offset
+        cycle_position = (t % _TAU) * _INV_TAU
 
         return on_color if cycle_position < duty_cycle else off_color
 
@@ -215,6 +259,7 @@ class ColorEffects:
         min_alpha: float = 0.0,
         max_alpha: float = 1.0,
         offset: float = 0.0,
+        now: Optional[float] = None,
     ) -> Tuple[int, int, int, int]:
         """Создает эффект плавного появления/исчезновения путем изменения альфа-канала.
 
@@ -224,11 +269,13 @@ class ColorEffects:
             min_alpha (float, optional): Минимальное значение альфа 0.0-1.0. По умолчанию 0.0.
             max_alpha (float, optional): Максимальное значение альфа 0.0-1.0. По умолчанию 1.0.
             offset (float, optional): Смещение времени. По умолчанию 0.0.
+            now (Optional[float], optional): Момент времени в секундах (как у time.time()); None — текущее.
+                Позволяет вычислить несколько эффектов по одной метке времени. По умолчанию None.
 
         Returns:
             Tuple[int, int, int, int]: Кортеж RGBA цвета.
         """
-        t = time.time() * speed + offset
+        t = (time.time() if now is None else now) * speed + offset
         alpha_value = (math.sin(t) + 1) / 2  # Normalize to 0-1
         alpha = min_alpha + (max_alpha - min_alpha) * alpha_value
 
@@ -750,6 +750,22 @@ class PlayerPrefs:
         data[key] = value
         cls._save_data(data)
 
+    @classmethod
+    def set_values(cls, values: Dict[str, Any]) -> None:
+        """Устанавливает несколько значений одной записью на диск.
+
+        Каждый set_* сохраняет весь файл настроек, поэтому связанные ключи
+        (например, покупка: цена, счёт, выбранный скин) выгоднее записать разом.
+
+        Args:
+            values (Dict[str, Any]): Пары ключ-значение для установки.
+        """
+        if not values:
+            return
+        data = cls._load_data()
+        data.update(values)
+        cls._save_data(data)
+
     @classmethod
     def get_float(cls, key: str, default: float = 0.0) -> float:
         """Получает значение с плавающей точкой по ключу.
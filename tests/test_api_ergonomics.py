@@ -123,3 +123,46 @@ class TestRuntimeSceneErgonomics:
     def test_on_click_missing_raises_key_error(self, runtime_scene):
         with pytest.raises(KeyError):
             runtime_scene.on_click("missing", lambda: None)
+
+
+class TestCameraKeyboardInput:
+    class _Keys:
+        def __init__(self, *pressed):
+            self.pressed = set(pressed)
+
+        def is_pressed(self, key):
+            return key in self.pressed
+
+        def is_mouse_pressed(self, button):
+            return False
+
+    def _step(self, *pressed, keys=None):
+        s.set_camera_position(0, 0)
+        camera = s.get_context().camera
+        pos = camera.process_input(
+            self._Keys(*pressed), 0.5, speed=100.0, keys=keys, mouse_drag=False
+        )
+        s.set_camera_position(0, 0)
+        return tuple(pos)
+
+    def test_diagonal_step_keeps_speed(self, clean_game):
+        import pygame
+
+        x, y = self._step(pygame.K_RIGHT, pygame.K_DOWN)
+        assert (x * x + y * y) ** 0.5 == pytest.approx(50.0)
+        assert x == pytest.approx(y)
+
+    def test_opposite_keys_cancel_and_custom_keys(self, clean_game):
+        import pygame
+
+        assert self._step(pygame.K_LEFT, pygame.K_RIGHT) == (0.0, 0.0)
+        pos = self._step(pygame.K_a, keys={"left": (pygame.K_a, pygame.K_LEFT)})
+        assert pos == pytest.approx((-50.0, 0.0))
+
+    def test_default_keys_cannot_be_mutated(self, clean_game):
+        from spritePro.game_context import DEFAULT_CAMERA_KEYS, CameraController
+
+        mapping = CameraController._normalize_camera_keys(None)
+        with pytest.raises(TypeError):
+            mapping["left"] = ()
+        assert DEFAULT_CAMERA_KEYS["left"]
@@ -1,5 +1,8 @@
 """Регрессионные тесты компонентов (аудит U3, U8, U9, U10, U12, U13, U18-U20)."""
 
+import math
+
+import pygame
 import pytest
 
 import spritePro as s
@@ -60,6 +63,39 @@ class TestColorEffects:
         color = color_effects.health_bar(0, max_health=0)
         assert isinstance(color, tuple)
 
+    def test_explicit_now_is_deterministic(self):
+        # Одна метка времени на кадр — одинаковый результат при повторном вызове
+        assert color_effects.pulse(2.0, now=10.0) == color_effects.pulse(2.0, now=10.0)
+        assert color_effects.rainbow(1.0, now=0.0) == (255, 0, 0)
+        strobe = color_effects.strobe(1.0, on_color=(1, 1, 1), off_color=(2, 2, 2), now=0.0)
+        assert strobe == (1, 1, 1)
+
+    def test_rainbow_table_matches_hsv(self):
+        import colorsys
+
+        # В пределах шага таблицы цвет совпадает с HSV её узла; насыщенность 0 — серый
+        color = color_effects.rainbow(1.0, now=math.tau * 64.5 / 256)
+        assert color == tuple(int(c * 255) for c in colorsys.hsv_to_rgb(64 / 256, 1, 1))
+        gray = color_effects.rainbow(1.0, saturation=0.0, brightness=0.5, now=1.0)
+        assert gray == (127, 127, 127)
+
+
+class TestBarWithBackground:
+    def test_clipped_fill_reuses_buffer(self, clean_game):
+        from spritePro.readySprites import BarWithBackground
+
+        bar = BarWithBackground(size=(100, 20), fill_amount=1.0, animate_duration=0)
+        bar.fill.color = (0, 255, 0)
+        buffer = bar._clipped_fill_surface
+        bar.set_fill_amount(0.5, animate=False)
+        # Тот же буфер, правая половина очищена от прошлого заполнения
+        assert bar._clipped_fill_surface is buffer
+        assert buffer.get_at((10, 10)).a == 255
+        assert buffer.get_at((90, 10)).a == 0
+
+        bar.set_fill_size((50, 10))
+        assert bar._clipped_fill_surface.get_size() == (50, 10)
+
 
 class TestPages:
     def test_bad_page_name_does_not_break_state(self, clean_game):
@@ -70,3 +106,76 @@ class TestPages:
             pm.set_active_page("nope")
         # get_active_page не должен бросать после неудачной установки
         pm.get_active_page()
+
+
+class TestPlayerPrefs:
+    def test_set_values_writes_file_once(self, tmp_path, monkeypatch):
+        from spritePro.utils.save_load import PlayerPrefs
+
+        monkeypatch.setattr(PlayerPrefs, "_instance", None)
+        monkeypatch.setattr(PlayerPrefs, "_cache", None)
+        prefs = PlayerPrefs(str(tmp_path / "prefs.json"))
+        saves = []
+        original_save = prefs._manager.save
+        monkeypatch.setattr(
+            prefs._manager, "save", lambda data: saves.append(data) or original_save(data)
+        )
+
+        PlayerPrefs.set_values({"score": 7, "skin_id": 2, "price_skins": [0, 0, 250]})
+
+        assert len(saves) == 1
+        assert PlayerPrefs.get_int("score") == 7
+        assert PlayerPrefs._get_value("price_skins", None) == [0, 0, 250]
+        monkeypatch.setattr(PlayerPrefs, "_cache", None)
+        assert PlayerPrefs.get_int("skin_id") == 2
+
+
+class TestTextFps:
+    def test_rolling_average_over_window(self, clean_game, monkeypatch):
+        from spritePro.readySprites import Text_fps
+
+        counter = Text_fps(average_frames=3)
+        for dt in (1 / 10, 1 / 20, 1 / 30, 1 / 40):
+            monkeypatch.setattr(s, "dt", dt)
+            counter.update_fps()
+        # В окне только 3 последних кадра: 20, 30, 40
+        assert list(counter.fps_history) == pytest.approx([20, 30, 40])
+        assert counter._fps_sum / len(counter.fps_history) == pytest.approx(30)
+
+        counter.set_averaging(2)
+        assert list(counter.fps_history) == pytest.approx([30, 40])
+        assert counter._fps_sum == pytest.approx(70)
+
+
+class TestWorldGrid:
+    def test_panning_redraws_into_same_buffer(self, clean_game):
+        from spritePro import grid_renderer
+
+        target = pygame.Surface((100, 100))
+        view = pygame.Rect(0, 0, 100, 100)
+
+        def draw(cam_x):
+            target.fill((0, 0, 0))
+            grid_renderer.draw_world_grid(
+                target,
+                view,
+                cam_x,
+                cam_x + 100,
+                0,
+                100,
+                lambda x, y: (x - cam_x, y),
+                grid_size=10,
+                zoom=1.0,
+                grid_color=(200, 0, 0),
+                major_color=(200, 0, 0),
+                super_color=(200, 0, 0),
+            )
+
+        draw(0)
+        buffer = grid_renderer._grid_cache_surf
+        assert target.get_at((10, 5))[:3] == (200, 0, 0)
+        draw(5)
+        assert grid_renderer._grid_cache_surf is buffer
+        # Сдвиг на 5: линия x=10 теперь на экране в 5, старая позиция очищена
+        assert target.get_at((5, 5))[:3] == (200, 0, 0)
+        assert target.get_at((10, 2))[:3] == (0, 0, 0)
@@ -5,7 +5,7 @@ import time
 
 import pytest
 
-from spritePro.networking import NetClient, NetServer
+from spritePro.networking import NetClient, NetServer, _decode_message, _encode_message
 from spritePro.multiplayer import MultiplayerContext, NetDebug
 
 
@@ -63,6 +63,15 @@ def _drain_events(client, events):
     return collected
 
 
+def test_encode_message_is_compact_and_roundtrips():
+    raw = _encode_message("pos", {"pos": [1.5, 2.0], "name": "Игрок"})
+    assert raw.endswith(b"\n")
+    assert b" " not in raw
+    assert "Игрок".encode("utf-8") in raw
+    msg = _decode_message(raw.decode("utf-8").strip())
+    assert msg == {"event": "pos", "data": {"pos": [1.5, 2.0], "name": "Игрок"}}
+
+
 def test_relay_between_clients(net_env):
     server, make_client = net_env
     c1 = make_client("c1")
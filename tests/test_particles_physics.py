@@ -32,6 +32,36 @@ class TestParticleSubpixel:
         assert 25 <= moved <= 35, f"частица должна пройти ~30px за секунду, прошла {moved}"
 
 
+class TestParticlePoolReset:
+    def _reset(self, p, image):
+        p.reset(
+            image=image,
+            pos=(10, 10),
+            velocity=pygame.math.Vector2(0, 0),
+            lifetime_ms=1000,
+            fade_speed=0.0,
+            gravity=pygame.math.Vector2(0, 0),
+            screen_space=True,
+        )
+
+    def test_same_image_keeps_copy(self, clean_game):
+        img = pygame.Surface((4, 4), pygame.SRCALPHA)
+        p = _make_particle()
+        self._reset(p, img)
+        original = p.original_image
+        p.set_scale(0.5)
+        self._reset(p, img)
+        assert p.original_image is original
+        assert p.scale == 1.0
+
+    def test_new_image_replaces_copy(self, clean_game):
+        p = _make_particle()
+        original = p.original_image
+        self._reset(p, pygame.Surface((6, 6), pygame.SRCALPHA))
+        assert p.original_image is not original
+        assert p.original_image.get_size() == (6, 6)
+
+
 class TestEmitterDestroy:
     def test_destroy_unregisters(self, clean_game):
         emitter = ParticleEmitter(auto_register=True)
@@ -127,3 +127,46 @@ class TestUpdateObjectRegistry:
             clean_game.register_update_object(o)
         clean_game.update()
         assert calls == ["0", "1", "2"]
+
+
+class TestTextRenderCache:
+    def test_repeated_text_is_not_rendered_again(self, clean_game, monkeypatch):
+        """Возврат к уже показанной строке берёт поверхность из общего кэша."""
+        from spritePro.components.text import TextSprite
+
+        label = s.TextSprite("cache-a", 18)
+        label.set_text("cache-b")
+        calls = []
+        original = TextSprite._render_text_multiline
+
+        def counting(self, text, line_spacing=2):
+            calls.append(text)
+            return original(self, text, line_spacing)
+
+        monkeypatch.setattr(TextSprite, "_render_text_multiline", counting)
+        label.set_text("cache-a")
+        other = s.TextSprite("cache-b", 18)
+        assert calls == []
+        assert label.text == "cache-a"
+        assert other.rect.size == other.image.get_size()
+
+
+class TestSetImageDisplayFormat:
+    def test_surface_copy_keeps_alpha_mode_and_colorkey(self, clean_game):
+        opaque = pygame.Surface((8, 8), 0, 24)
+        opaque.fill((10, 20, 30))
+        opaque.set_colorkey((0, 0, 0))
+        opaque.set_alpha(120)
+        sprite = s.Sprite(opaque, size=(8, 8))
+        img = sprite.original_image
+        assert img is not opaque
+        assert img.get_bitsize() == s.screen.get_bitsize()
+        assert img.get_masks()[3] == 0  # без попиксельной альфы
+        assert img.get_colorkey()[:3] == (0, 0, 0)
+        assert img.get_alpha() == 120
+
+        translucent = pygame.Surface((8, 8), pygame.SRCALPHA)
+        translucent.fill((1, 2, 3, 50))
+        img = s.Sprite(translucent, size=(8, 8)).original_image
+        assert img.get_masks()[3] != 0
+        assert img.get_at((0, 0)) == (1, 2, 3, 50)